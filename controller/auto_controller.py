@@ -3,9 +3,13 @@ Controlador para la gestión de autos
 Intermediario entre la vista y el modelo
 """
 from model.auto_model import AutoModel
+from model.conexion import db
 from utils.validators import Validator
 from utils.cloudinary_service import CloudinaryService
+from utils.image_loader import ImageLoader
+from utils.image_optimizer import ImageOptimizer
 from pathlib import Path
+import os
 
 class AutoController:
     """Controlador para operaciones de autos"""
@@ -46,6 +50,9 @@ class AutoController:
         """
         Sube una imagen a Cloudinary
         
+        Antes de subirla se corrige su orientación, se reduce al tamaño
+        máximo configurado y se recomprime (ver ImageOptimizer).
+        
         Args:
             source_path (str): Ruta local de la imagen
             
@@ -60,8 +67,18 @@ class AutoController:
             if not source.exists():
                 return None, None
             
+            # Reducir la imagen localmente para subir menos bytes
+            optimizada, upload_path = ImageOptimizer.optimize_for_upload(str(source))
+            if not optimizada:
+                print(f"⚠️ {upload_path}; se sube la imagen original")
+                upload_path = str(source)
+            
             # Subir a Cloudinary
-            success, url_or_error, public_id = CloudinaryService.upload_image(str(source), folder="gestion-autos/autos")
+            try:
+                success, url_or_error, public_id = CloudinaryService.upload_image(upload_path, folder="gestion-autos/autos")
+            finally:
+                if upload_path != str(source) and os.path.exists(upload_path):
+                    os.remove(upload_path)
             
             if success:
                 return url_or_error, public_id
@@ -114,31 +131,95 @@ class AutoController:
         if not valid:
             return False, msg
         
-        # Obtener datos actuales del auto para eliminar imagen anterior si existe
         imagen_url = None
         cloudinary_id = None
         
+        # Subir la nueva imagen antes de tocar la base de datos
         if imagen_path:
-            # Obtener el auto actual
-            success_get, auto_actual = AutoModel.obtener_por_id(id_auto)
+            imagen_url, cloudinary_id = AutoController.guardar_imagen(imagen_path)
+        
+        # Leer la imagen anterior y actualizar el auto con un solo COMMIT
+        imagen_anterior = None
+        url_anterior = None
+        with db.transaction() as tx:
+            if cloudinary_id:
+                success_get, auto_actual = AutoModel.obtener_por_id(id_auto)
+                if success_get and auto_actual:
+                    imagen_anterior = auto_actual.get('cloudinary_id')
+                    url_anterior = auto_actual.get('imagen')
             
-            # Si hay una imagen anterior en Cloudinary, eliminarla
-            if success_get and auto_actual.get('cloudinary_id'):
-                CloudinaryService.delete_image(auto_actual['cloudinary_id'])
+            success, result = AutoModel.actualizar_auto(
+                id_auto, marca, modelo, anio, precio, color, transmision, combustible, imagen_url, cloudinary_id
+            )
+            if not success:
+                tx.rollback(result)
+        
+        if not tx.success:
+            # Descartar la imagen recién subida para no dejarla huérfana
+            if cloudinary_id:
+                CloudinaryService.delete_image(cloudinary_id)
+            return False, result if not success else tx.error
+        
+        # Eliminar la imagen anterior solo cuando el cambio quedó confirmado
+        if imagen_anterior and imagen_anterior != cloudinary_id:
+            CloudinaryService.delete_image(imagen_anterior)
+            # La miniatura anterior ya no se usará: sacarla del caché local
+            ImageLoader.invalidate(url_anterior)
+        
+        return True, result
+    
+    @staticmethod
+    def crear_autos_bulk(autos, chunk_size=500):
+        """
+        Crea muchos autos en una sola transacción después de validar cada uno
+        
+        Args:
+            autos: Lista de diccionarios con las claves de crear_auto
+                   (imagen_url y cloudinary_id opcionales)
+            chunk_size: Cantidad de filas por sentencia INSERT
+        
+        Returns:
+            tuple: (success, {'insertados', 'errores': [(indice, mensaje)]}/error_message)
+        """
+        filas = []
+        indices = []
+        errores = []
+        
+        for i, auto in enumerate(autos):
+            valid, msg = AutoController.validar_datos_auto(
+                auto.get('marca'), auto.get('modelo'), auto.get('anio'), auto.get('precio'),
+                auto.get('color'), auto.get('transmision'), auto.get('combustible')
+            )
+            if not valid:
+                errores.append((i, msg))
+                continue
             
-            # Subir nueva imagen
-            imagen_url, cloudinary_id = AutoController.guardar_imagen(imagen_path)
+            filas.append((
+                auto['marca'], auto['modelo'], auto['anio'], auto['precio'], auto['color'],
+                auto.get('transmision') or 'Manual', auto.get('combustible') or 'Gasolina',
+                auto.get('imagen_url'), auto.get('cloudinary_id')
+            ))
+            indices.append(i)
         
-        # Actualizar el auto
-        return AutoModel.actualizar_auto(
-            id_auto, marca, modelo, anio, precio, color, transmision, combustible, imagen_url, cloudinary_id
-        )
+        success, result = AutoModel.crear_autos_bulk(filas, chunk_size)
+        if not success:
+            return False, result
+        
+        # Traducir los índices del modelo a las posiciones originales
+        errores.extend((indices[i], msg) for i, msg in result['errores'])
+        errores.sort()
+        return True, {'insertados': result['insertados'], 'errores': errores}
     
     @staticmethod
     def obtener_todos():
         """Obtiene todos los autos"""
         return AutoModel.obtener_todos()
     
+    @staticmethod
+    def obtener_pagina(limite=50, cursor=None):
+        """Obtiene una página de autos (paginación por llave)"""
+        return AutoModel.obtener_pagina(limite, cursor)
+    
     @staticmethod
     def obtener_por_id(id_auto):
         """Obtiene un auto por ID"""
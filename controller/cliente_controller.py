@@ -67,11 +67,59 @@ class ClienteController:
         # Actualizar el cliente
         return ClienteModel.actualizar_cliente(id_cliente, nombre, telefono, correo, direccion)
     
+    @staticmethod
+    def crear_clientes_bulk(clientes, chunk_size=500):
+        """
+        Crea muchos clientes en una sola transacción después de validar cada uno
+        
+        Args:
+            clientes: Lista de diccionarios con nombre, telefono, correo y direccion
+            chunk_size: Cantidad de filas por sentencia INSERT
+        
+        Returns:
+            tuple: (success, {'insertados', 'errores': [(indice, mensaje)]}/error_message)
+        """
+        filas = []
+        indices = []
+        errores = []
+        
+        for i, cliente in enumerate(clientes):
+            datos = (
+                cliente.get('nombre'), cliente.get('telefono'),
+                cliente.get('correo'), cliente.get('direccion')
+            )
+            valid, msg = ClienteController.validar_datos_cliente(*datos)
+            if not valid:
+                errores.append((i, msg))
+                continue
+            
+            filas.append(datos)
+            indices.append(i)
+        
+        success, result = ClienteModel.crear_clientes_bulk(filas, chunk_size)
+        if not success:
+            return False, result
+        
+        # Traducir los índices del modelo a las posiciones originales
+        errores.extend((indices[i], msg) for i, msg in result['errores'])
+        errores.sort()
+        return True, {'insertados': result['insertados'], 'errores': errores}
+    
     @staticmethod
     def obtener_todos():
         """Obtiene todos los clientes"""
         return ClienteModel.obtener_todos()
     
+    @staticmethod
+    def iterar_todos(batch_size=500):
+        """Recorre todos los clientes en bloques (para reportes y exportaciones)"""
+        return ClienteModel.iterar_todos(batch_size)
+    
+    @staticmethod
+    def obtener_pagina(limite=50, cursor=None):
+        """Obtiene una página de clientes (paginación por llave)"""
+        return ClienteModel.obtener_pagina(limite, cursor)
+    
     @staticmethod
     def obtener_por_id(id_cliente):
         """Obtiene un cliente por ID"""
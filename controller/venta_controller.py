@@ -68,11 +68,56 @@ class VentaController:
         # Actualizar la venta
         return VentaModel.actualizar_venta(id_venta, id_auto, id_cliente, monto, metodo_pago, fecha_venta)
     
+    @staticmethod
+    def crear_ventas_bulk(ventas, chunk_size=500):
+        """
+        Crea muchas ventas en una sola transacción después de validar cada una
+        
+        Args:
+            ventas: Lista de diccionarios con id_auto, id_cliente, monto,
+                    metodo_pago y fecha_venta (opcional)
+            chunk_size: Cantidad de filas por sentencia INSERT
+        
+        Returns:
+            tuple: (success, {'insertados', 'errores': [(indice, mensaje)]}/error_message)
+        """
+        filas = []
+        indices = []
+        errores = []
+        
+        for i, venta in enumerate(ventas):
+            valid, msg = VentaController.validar_datos_venta(
+                venta.get('id_auto'), venta.get('id_cliente'), venta.get('monto'), venta.get('metodo_pago')
+            )
+            if not valid:
+                errores.append((i, msg))
+                continue
+            
+            filas.append((
+                venta['id_auto'], venta['id_cliente'], venta['monto'],
+                venta['metodo_pago'], venta.get('fecha_venta')
+            ))
+            indices.append(i)
+        
+        success, result = VentaModel.crear_ventas_bulk(filas, chunk_size)
+        if not success:
+            return False, result
+        
+        # Traducir los índices del modelo a las posiciones originales
+        errores.extend((indices[i], msg) for i, msg in result['errores'])
+        errores.sort()
+        return True, {'insertados': result['insertados'], 'errores': errores}
+    
     @staticmethod
     def obtener_todas():
         """Obtiene todas las ventas"""
         return VentaModel.obtener_todas()
     
+    @staticmethod
+    def obtener_pagina(limite=50, cursor=None):
+        """Obtiene una página de ventas (paginación por llave)"""
+        return VentaModel.obtener_pagina(limite, cursor)
+    
     @staticmethod
     def obtener_por_id(id_venta):
         """Obtiene una venta por ID"""
@@ -0,0 +1,15 @@
+-- Migración 001: índices para los ORDER BY y filtros de las vistas
+-- Evita el filesort en cada carga de autos, clientes y ventas
+-- y sirve de llave para la paginación por llave (keyset)
+
+-- Autos: listado ordenado por fecha de registro (más recientes primero)
+CREATE INDEX idx_autos_fecha_registro ON autos (fecha_registro, id_auto);
+
+-- Clientes: listado ordenado por nombre
+CREATE INDEX idx_clientes_nombre ON clientes (nombre, id_cliente);
+
+-- Ventas: listado ordenado por fecha de venta
+CREATE INDEX idx_ventas_fecha_venta ON ventas (fecha_venta, id_venta);
+
+-- Ventas de un cliente ordenadas por fecha (obtener_ventas_por_cliente)
+CREATE INDEX idx_ventas_cliente_fecha ON ventas (id_cliente, fecha_venta);
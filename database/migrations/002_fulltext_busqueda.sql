@@ -0,0 +1,10 @@
+-- Migración 002: índices FULLTEXT con parser ngram para la búsqueda
+-- de autos y clientes (MATCH ... AGAINST en lugar de LIKE '%...%').
+-- En servidores sin el parser ngram (p. ej. MariaDB) se omiten y la
+-- búsqueda sigue usando LIKE.
+
+-- opcional
+ALTER TABLE autos ADD FULLTEXT INDEX ft_autos_busqueda (marca, modelo, color) WITH PARSER ngram;
+
+-- opcional
+ALTER TABLE clientes ADD FULLTEXT INDEX ft_clientes_busqueda (nombre, telefono, correo) WITH PARSER ngram;
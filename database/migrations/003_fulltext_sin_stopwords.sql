@@ -0,0 +1,23 @@
+-- Migración 003: reconstruye los índices FULLTEXT de la migración 002 sin
+-- la lista de stopwords de InnoDB. Con el parser ngram se descarta todo
+-- token que contenga una stopword ("a", "i", "in", "to", "an", "at"...),
+-- así búsquedas de dos letras como "ma" o "an" no encontraban nada.
+-- La lista se asocia al índice al crearlo, por eso hay que reconstruirlo.
+-- En servidores sin el parser ngram (p. ej. MariaDB) se omiten.
+
+-- opcional
+SET SESSION innodb_ft_enable_stopword = OFF;
+
+-- opcional
+ALTER TABLE autos
+    DROP INDEX ft_autos_busqueda,
+    ADD FULLTEXT INDEX ft_autos_busqueda (marca, modelo, color) WITH PARSER ngram;
+
+-- opcional
+ALTER TABLE clientes
+    DROP INDEX ft_clientes_busqueda,
+    ADD FULLTEXT INDEX ft_clientes_busqueda (nombre, telefono, correo) WITH PARSER ngram;
+
+-- La conexión vuelve al pool: restaurar el valor por defecto
+-- opcional
+SET SESSION innodb_ft_enable_stopword = ON;
@@ -3,6 +3,8 @@ Modelo de datos para la tabla de autos
 Implementa todas las operaciones CRUD
 """
 from model.conexion import db
+from model.paginacion import Paginacion
+from model.busqueda import Busqueda
 
 class AutoModel:
     """Clase para gestionar operaciones CRUD de autos"""
@@ -26,6 +28,25 @@ class AutoModel:
         params = (marca, modelo, anio, precio, color, transmision, combustible, imagen_url, cloudinary_id)
         return db.execute_query(query, params)
     
+    @staticmethod
+    def crear_autos_bulk(autos, chunk_size=500):
+        """
+        Crea varios autos en una sola transacción usando INSERT multi-fila
+        
+        Args:
+            autos: Lista de tuplas (marca, modelo, anio, precio, color, transmision,
+                   combustible, imagen_url, cloudinary_id)
+            chunk_size: Cantidad de filas por sentencia INSERT
+        
+        Returns:
+            tuple: (success, {'insertados', 'errores': [(indice, mensaje)]}/error_message)
+        """
+        query = """
+            INSERT INTO autos (marca, modelo, anio, precio, color, transmision, combustible, imagen, cloudinary_id)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """
+        return db.execute_many(query, autos, chunk_size)
+    
     @staticmethod
     def obtener_todos():
         """
@@ -37,6 +58,48 @@ class AutoModel:
         query = "SELECT * FROM autos ORDER BY fecha_registro DESC"
         return db.fetch_all(query)
     
+    @staticmethod
+    def obtener_pagina(limite=50, cursor=None):
+        """
+        Obtiene una página de autos ordenada por fecha de registro (más recientes primero)
+        
+        Usa paginación por llave sobre (fecha_registro, id_auto), por lo que el
+        costo de cada página no crece con el tamaño de la tabla.
+        
+        Args:
+            limite: Cantidad de autos por página
+            cursor: Token 'siguiente' devuelto por la página anterior
+        
+        Returns:
+            tuple: (success, {'items', 'siguiente'}/error_message)
+        """
+        limite = Paginacion.normalizar_limite(limite)
+        columnas = ('fecha_registro', 'id_auto')
+        
+        if cursor:
+            llave = Paginacion.decodificar_cursor(cursor, len(columnas))
+            if llave is None:
+                return False, "Cursor de paginación inválido"
+            query = """
+                SELECT * FROM autos
+                WHERE fecha_registro < %s OR (fecha_registro = %s AND id_auto < %s)
+                ORDER BY fecha_registro DESC, id_auto DESC
+                LIMIT %s
+            """
+            params = (llave[0], llave[0], llave[1], limite + 1)
+        else:
+            query = """
+                SELECT * FROM autos
+                ORDER BY fecha_registro DESC, id_auto DESC
+                LIMIT %s
+            """
+            params = (limite + 1,)
+        
+        success, result = db.fetch_all(query, params)
+        if not success:
+            return False, result
+        return True, Paginacion.construir_pagina(result, limite, columnas)
+    
     @staticmethod
     def obtener_por_id(id_auto):
         """
@@ -95,9 +158,25 @@ class AutoModel:
         """
         Busca autos por marca, modelo o color
         
+        Usa el índice FULLTEXT ft_autos_busqueda ordenando por relevancia;
+        si no está disponible, el término es muy corto o no hay resultados
+        (p. ej. un índice creado con stopwords) se usa LIKE.
+        
         Returns:
             tuple: (success, list_of_autos/error_message)
         """
+        expresion = Busqueda.expresion_fulltext('autos', 'ft_autos_busqueda', criterio)
+        if expresion:
+            query = """
+                SELECT *, MATCH(marca, modelo, color) AGAINST (%s IN BOOLEAN MODE) AS relevancia
+                FROM autos
+                WHERE MATCH(marca, modelo, color) AGAINST (%s IN BOOLEAN MODE)
+                ORDER BY relevancia DESC, fecha_registro DESC
+            """
+            success, result = db.fetch_all(query, (expresion, expresion))
+            if success and result:
+                return success, result
+        
         query = """
             SELECT * FROM autos 
             WHERE marca LIKE %s OR modelo LIKE %s OR color LIKE %s
@@ -0,0 +1,43 @@
+"""
+Búsqueda de texto con índices FULLTEXT (parser ngram)
+Si el índice no existe en el servidor se usa el respaldo con LIKE
+"""
+import re
+from model.conexion import db
+
+class Busqueda:
+    """Funciones auxiliares para búsquedas MATCH ... AGAINST"""
+    
+    # Tamaño mínimo de término que indexa el parser ngram (ngram_token_size)
+    LONGITUD_MINIMA = 2
+    
+    @staticmethod
+    def expresion_booleana(criterio):
+        """
+        Convierte el texto buscado en una expresión para IN BOOLEAN MODE
+        
+        Cada palabra se busca como frase obligatoria (+"palabra"); con el
+        parser ngram eso equivale a buscar la subcadena, como hacía LIKE,
+        siempre que el índice se haya creado sin stopwords (migración 003).
+        Aun así quien llama debe recurrir a LIKE si no hay resultados.
+        
+        Returns:
+            str: Expresión booleana o None si algún término es muy corto
+        """
+        palabras = re.sub(r'["+\-<>()~*@]', ' ', criterio or '').split()
+        if not palabras or any(len(p) < Busqueda.LONGITUD_MINIMA for p in palabras):
+            return None
+        return ' '.join(f'+"{p}"' for p in palabras)
+    
+    @staticmethod
+    def expresion_fulltext(tabla, indice, criterio):
+        """
+        Retorna la expresión FULLTEXT si la búsqueda puede usar el índice
+        
+        Returns:
+            str: Expresión booleana o None si se debe usar LIKE
+        """
+        expresion = Busqueda.expresion_booleana(criterio)
+        if expresion and db.has_index(tabla, indice):
+            return expresion
+        return None
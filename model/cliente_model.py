@@ -3,6 +3,8 @@ Modelo de datos para la tabla de clientes
 Implementa todas las operaciones CRUD
 """
 from model.conexion import db
+from model.paginacion import Paginacion
+from model.busqueda import Busqueda
 
 class ClienteModel:
     """Clase para gestionar operaciones CRUD de clientes"""
@@ -22,6 +24,24 @@ class ClienteModel:
         params = (nombre, telefono, correo, direccion)
         return db.execute_query(query, params)
     
+    @staticmethod
+    def crear_clientes_bulk(clientes, chunk_size=500):
+        """
+        Crea varios clientes en una sola transacción usando INSERT multi-fila
+        
+        Args:
+            clientes: Lista de tuplas (nombre, telefono, correo, direccion)
+            chunk_size: Cantidad de filas por sentencia INSERT
+        
+        Returns:
+            tuple: (success, {'insertados', 'errores': [(indice, mensaje)]}/error_message)
+        """
+        query = """
+            INSERT INTO clientes (nombre, telefono, correo, direccion)
+            VALUES (%s, %s, %s, %s)
+        """
+        return db.execute_many(query, clientes, chunk_size)
+    
     @staticmethod
     def obtener_todos():
         """
@@ -33,6 +53,59 @@ class ClienteModel:
         query = "SELECT * FROM clientes ORDER BY nombre"
         return db.fetch_all(query)
     
+    @staticmethod
+    def iterar_todos(batch_size=500):
+        """
+        Recorre todos los clientes sin cargarlos completos en memoria
+        
+        Returns:
+            generator: Filas de clientes ordenadas por nombre
+        """
+        query = "SELECT * FROM clientes ORDER BY nombre"
+        return db.fetch_iter(query, batch_size=batch_size)
+    
+    @staticmethod
+    def obtener_pagina(limite=50, cursor=None):
+        """
+        Obtiene una página de clientes ordenada por nombre
+        
+        Usa paginación por llave sobre (nombre, id_cliente), por lo que el
+        costo de cada página no crece con el tamaño de la tabla.
+        
+        Args:
+            limite: Cantidad de clientes por página
+            cursor: Token 'siguiente' devuelto por la página anterior
+        
+        Returns:
+            tuple: (success, {'items', 'siguiente'}/error_message)
+        """
+        limite = Paginacion.normalizar_limite(limite)
+        columnas = ('nombre', 'id_cliente')
+        
+        if cursor:
+            llave = Paginacion.decodificar_cursor(cursor, len(columnas))
+            if llave is None:
+                return False, "Cursor de paginación inválido"
+            query = """
+                SELECT * FROM clientes
+                WHERE nombre > %s OR (nombre = %s AND id_cliente > %s)
+                ORDER BY nombre, id_cliente
+                LIMIT %s
+            """
+            params = (llave[0], llave[0], llave[1], limite + 1)
+        else:
+            query = """
+                SELECT * FROM clientes
+                ORDER BY nombre, id_cliente
+                LIMIT %s
+            """
+            params = (limite + 1,)
+        
+        success, result = db.fetch_all(query, params)
+        if not success:
+            return False, result
+        return True, Paginacion.construir_pagina(result, limite, columnas)
+    
     @staticmethod
     def obtener_por_id(id_cliente):
         """
@@ -76,9 +149,25 @@ class ClienteModel:
         """
         Busca clientes por nombre, teléfono o correo
         
+        Usa el índice FULLTEXT ft_clientes_busqueda ordenando por relevancia;
+        si no está disponible, el término es muy corto o no hay resultados
+        (p. ej. un índice creado con stopwords) se usa LIKE.
+        
         Returns:
             tuple: (success, list_of_clientes/error_message)
         """
+        expresion = Busqueda.expresion_fulltext('clientes', 'ft_clientes_busqueda', criterio)
+        if expresion:
+            query = """
+                SELECT *, MATCH(nombre, telefono, correo) AGAINST (%s IN BOOLEAN MODE) AS relevancia
+                FROM clientes
+                WHERE MATCH(nombre, telefono, correo) AGAINST (%s IN BOOLEAN MODE)
+                ORDER BY relevancia DESC, nombre
+            """
+            success, result = db.fetch_all(query, (expresion, expresion))
+            if success and result:
+                return success, result
+        
         query = """
             SELECT * FROM clientes 
             WHERE nombre LIKE %s OR telefono LIKE %s OR correo LIKE %s
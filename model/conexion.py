@@ -1,46 +1,514 @@
 """
 Gestión de conexión a la base de datos MySQL
 Compatible con Windows y Linux
+Soporta un pool de conexiones con afinidad por hilo
+y reconexión automática cuando MySQL cierra conexiones inactivas.
+Las consultas se ejecutan como sentencias preparadas reutilizables
+y pueden agruparse en transacciones con db.transaction().
 """
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
+from mysql.connector.errors import OperationalError, PoolError
 import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from queue import Queue, Empty
 from dotenv import load_dotenv
 
 # Cargar variables de entorno
 load_dotenv()
 
+class Transaction:
+    """Estado de una transacción abierta con DatabaseConnection.transaction()"""
+    
+    def __init__(self):
+        self.error = None
+    
+    @property
+    def success(self):
+        """Indica si la transacción no tuvo errores"""
+        return self.error is None
+    
+    def rollback(self, message="Transacción cancelada"):
+        """Marca la transacción para deshacerse al salir del bloque"""
+        if self.error is None:
+            self.error = message
+
 class DatabaseConnection:
     """Clase para gestionar la conexión a MySQL"""
     
-    def __init__(self, host=None, user=None, password=None, database=None):
+    def __init__(self, host=None, user=None, password=None, database=None, pool_size=None, pool_timeout=None):
         # Intentar cargar desde variables de entorno, sino usar valores por defecto
         self.host = host or os.getenv('DB_HOST', 'localhost')
         self.user = user or os.getenv('DB_USER', 'root')
         self.password = password or os.getenv('DB_PASSWORD', '')
         self.database = database or os.getenv('DB_NAME', 'venta_autos_db')
         self.connection = None
+        
+        # Configuración del pool (0 = una sola conexión compartida)
+        self.pool_size = int(pool_size if pool_size is not None else os.getenv('DB_POOL_SIZE', 5))
+        self.pool_timeout = float(pool_timeout if pool_timeout is not None else os.getenv('DB_POOL_TIMEOUT', 10))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._pool_created = 0
+        
+        # Sin pool, los hilos usan la conexión compartida por turnos
+        # (reentrante para las llamadas anidadas del mismo hilo)
+        self._shared_lock = threading.RLock()
+        
+        # Conexión asignada a cada hilo (afinidad por hilo)
+        self._local = threading.local()
+        
+        # Verificación de salud y reconexión automática
+        self.health_check_interval = float(os.getenv('DB_HEALTH_CHECK_INTERVAL', 30))
+        self.retry_attempts = int(os.getenv('DB_RETRY_ATTEMPTS', 5))
+        self.retry_delay = float(os.getenv('DB_RETRY_DELAY', 0.5))
+        self.retry_max_delay = 8.0
+        self.read_retries = 1
+        self._last_used = {}
+        
+        # Registro de sentencias preparadas por conexión (clave: texto de la consulta)
+        self.use_prepared = os.getenv('DB_PREPARED_STATEMENTS', '1') != '0'
+        self.max_prepared_statements = int(os.getenv('DB_MAX_PREPARED_STATEMENTS', 64))
+        self._statements = {}
+        self._stats_lock = threading.Lock()
+        self._statement_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        
+        # Índices encontrados en el esquema (consultados una vez)
+        self._indexes = {}
+    
+    def _new_connection(self):
+        """Abre una nueva conexión física con MySQL"""
+        return mysql.connector.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            # Cada sentencia se confirma sola; las transacciones se abren
+            # explícitamente con transaction()
+            autocommit=True
+        )
     
     def connect(self):
         """Establece la conexión con la base de datos"""
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
-            if self.connection.is_connected():
-                return True, "Conexión exitosa"
+            if self.pool_size > 0:
+                # Se abre una conexión inicial para validar las credenciales;
+                # el resto se crean bajo demanda hasta pool_size
+                self._pool = Queue(maxsize=self.pool_size)
+                connection = self._new_connection()
+                self._pool_created = 1
+                self._pool.put(connection)
+                if connection.is_connected():
+                    return True, "Conexión exitosa"
+            else:
+                self.connection = self._new_connection()
+                if self.connection.is_connected():
+                    return True, "Conexión exitosa"
         except Error as e:
             return False, f"Error al conectar: {str(e)}"
         return False, "No se pudo establecer la conexión"
     
     def disconnect(self):
         """Cierra la conexión con la base de datos"""
+        if self._pool is not None:
+            while True:
+                try:
+                    connection = self._pool.get_nowait()
+                except Empty:
+                    break
+                try:
+                    connection.close()
+                except Error:
+                    pass
+            self._pool = None
+            self._pool_created = 0
+        
+        self._statements.clear()
+        self._indexes.clear()
+        
         if self.connection and self.connection.is_connected():
             self.connection.close()
     
+    def checkout(self):
+        """
+        Obtiene una conexión para el hilo actual
+        
+        Si el hilo ya tiene una conexión asignada se reutiliza la misma,
+        de modo que las llamadas anidadas comparten conexión. Sin pool
+        (pool_size = 0) todos los hilos usan la misma conexión, que MySQL
+        no admite en paralelo: cada hilo espera su turno hasta el checkin().
+        
+        Returns:
+            MySQLConnection: Conexión lista para usar
+        
+        Raises:
+            PoolError: Si el pool está agotado tras esperar pool_timeout segundos
+        """
+        local = self._local
+        if self._pool is None:
+            self._shared_lock.acquire()
+            local.shared_depth = getattr(local, 'shared_depth', 0) + 1
+            return self.connection
+        
+        if getattr(local, 'connection', None) is not None:
+            local.depth += 1
+            return local.connection
+        
+        connection = self._acquire()
+        local.connection = connection
+        local.depth = 1
+        return connection
+    
+    def _acquire(self):
+        """
+        Toma una conexión libre del pool, creándola si aún hay cupo
+        
+        Sin pool se abre una conexión nueva (se cierra en _release).
+        
+        Raises:
+            PoolError: Si el pool está agotado tras esperar pool_timeout segundos
+        """
+        if self._pool is None:
+            return self._new_connection()
+        
+        try:
+            return self._pool.get_nowait()
+        except Empty:
+            pass
+        
+        with self._pool_lock:
+            crear = self._pool_created < self.pool_size
+            if crear:
+                self._pool_created += 1
+        
+        if crear:
+            try:
+                return self._new_connection()
+            except Error:
+                with self._pool_lock:
+                    self._pool_created -= 1
+                raise
+        
+        try:
+            return self._pool.get(timeout=self.pool_timeout)
+        except Empty:
+            raise PoolError("No hay conexiones disponibles en el pool")
+    
+    def _release(self, connection):
+        """Devuelve al pool una conexión obtenida con _acquire()"""
+        self._last_used[id(connection)] = time.monotonic()
+        if self._pool is None:
+            self._forget_statements(connection)
+            self._last_used.pop(id(connection), None)
+            try:
+                connection.close()
+            except Error:
+                pass
+            return
+        self._pool.put(connection)
+    
+    def _discard(self, connection):
+        """
+        Cierra una conexión obtenida con _acquire() sin devolverla al pool
+        
+        Se usa cuando quedó en un estado que no se puede reutilizar (p. ej.
+        un resultado sin leer); su cupo queda libre para abrir otra.
+        """
+        self._forget_statements(connection)
+        self._last_used.pop(id(connection), None)
+        try:
+            connection.close()
+        except Error:
+            pass
+        if self._pool is not None:
+            with self._pool_lock:
+                self._pool_created -= 1
+    
+    def checkin(self, connection):
+        """
+        Devuelve al pool la conexión obtenida con checkout()
+        
+        La conexión solo se libera cuando el hilo cierra su último checkout.
+        """
+        local = self._local
+        if self._pool is None:
+            # Se cede el turno aunque la conexión compartida no exista
+            if getattr(local, 'shared_depth', 0) > 0:
+                local.shared_depth -= 1
+                self._shared_lock.release()
+        
+        if connection is None:
+            return
+        
+        self._last_used[id(connection)] = time.monotonic()
+        
+        if self._pool is None:
+            return
+        
+        if getattr(local, 'connection', None) is not connection:
+            return
+        
+        local.depth -= 1
+        if local.depth > 0:
+            return
+        
+        local.connection = None
+        self._release(connection)
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Agrupa varias operaciones en una sola transacción
+        
+        Todas las consultas del hilo actual dentro del bloque usan la misma
+        conexión y se confirman con un único COMMIT al salir. Si se lanza una
+        excepción, alguna consulta falla o se llama a rollback(), se deshace
+        todo el bloque. Los bloques anidados se unen a la transacción externa.
+        
+        Uso:
+            with db.transaction() as tx:
+                AutoModel.actualizar_auto(...)
+                VentaModel.crear_venta(...)
+            if not tx.success:
+                print(tx.error)
+        
+        Yields:
+            Transaction: Estado de la transacción (success, error, rollback())
+        """
+        local = self._local
+        actual = getattr(local, 'transaction', None)
+        if actual is not None:
+            yield actual
+            return
+        
+        transaccion = Transaction()
+        connection = None
+        try:
+            connection = self.checkout()
+            self._ensure_alive(connection)
+            connection.start_transaction()
+        except Error as e:
+            self.checkin(connection)
+            connection = None
+            transaccion.rollback(f"No se pudo iniciar la transacción: {str(e)}")
+        
+        local.transaction = transaccion
+        try:
+            yield transaccion
+        except BaseException as e:
+            transaccion.rollback(str(e) or type(e).__name__)
+            raise
+        finally:
+            local.transaction = None
+            if connection is not None:
+                try:
+                    if transaccion.success:
+                        connection.commit()
+                    else:
+                        connection.rollback()
+                except Error as e:
+                    transaccion.rollback(f"Error al confirmar la transacción: {str(e)}")
+                    try:
+                        connection.rollback()
+                    except Error:
+                        pass
+                self.checkin(connection)
+    
+    @staticmethod
+    def _is_connection_error(error):
+        """
+        Indica si el error se debe a una conexión perdida con el servidor
+        
+        Se decide por el código de error: InterfaceError también se lanza
+        por problemas de la fila (p. ej. un tipo de Python que no se puede
+        convertir) y esos no deben tratarse como conexión caída.
+        """
+        errno = getattr(error, 'errno', None)
+        
+        # "MySQL Connection not available": error del cliente sin código
+        if isinstance(error, OperationalError) and errno == -1:
+            return True
+        return errno in (
+            errorcode.CR_CONNECTION_ERROR,
+            errorcode.CR_CONN_HOST_ERROR,
+            errorcode.CR_SERVER_GONE_ERROR,
+            errorcode.CR_SERVER_LOST,
+            errorcode.CR_SERVER_LOST_EXTENDED,
+        )
+    
+    def _reconnect(self, connection):
+        """
+        Reabre una conexión caída con reintentos y backoff exponencial acotado
+        
+        Raises:
+            Error: Si no se logra reconectar tras retry_attempts intentos
+        """
+        delay = self.retry_delay
+        for intento in range(1, self.retry_attempts + 1):
+            try:
+                # Las sentencias preparadas mueren con la sesión anterior
+                self._forget_statements(connection)
+                connection.reconnect(attempts=1, delay=0)
+                self._last_used[id(connection)] = time.monotonic()
+                return
+            except Error:
+                if intento == self.retry_attempts:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, self.retry_max_delay)
+    
+    def _ensure_alive(self, connection):
+        """
+        Verifica que la conexión siga viva y la reabre si MySQL la cerró
+        
+        Solo se hace ping si la conexión estuvo inactiva más de
+        health_check_interval segundos, así las consultas seguidas
+        no pagan un round-trip extra.
+        """
+        if connection is None:
+            return
+        
+        ultimo_uso = self._last_used.get(id(connection))
+        if ultimo_uso is not None and time.monotonic() - ultimo_uso < self.health_check_interval:
+            return
+        
+        try:
+            connection.ping(reconnect=False)
+        except Error:
+            self._reconnect(connection)
+    
+    def _run(self, operation, idempotent=False):
+        """
+        Ejecuta operation(connection) con la conexión del hilo actual
+        
+        Antes de usar la conexión se verifica su estado. Si se pierde
+        durante una operación idempotente (lectura), se reconecta y se
+        reintenta hasta read_retries veces.
+        
+        Dentro de una transacción no se reconecta ni se reintenta: perder
+        la conexión implica perder la transacción, y el error la marca
+        para ROLLBACK.
+        
+        Raises:
+            Error: El último error de MySQL si no se pudo completar
+        """
+        transaccion = getattr(self._local, 'transaction', None)
+        if transaccion is not None:
+            if not transaccion.success:
+                raise Error(msg=f"Transacción cancelada: {transaccion.error}")
+            connection = self.checkout()
+            try:
+                return operation(connection)
+            except Error as e:
+                transaccion.rollback(str(e))
+                raise
+            finally:
+                self.checkin(connection)
+        
+        intentos = 1 + (self.read_retries if idempotent else 0)
+        for intento in range(1, intentos + 1):
+            connection = None
+            try:
+                connection = self.checkout()
+                self._ensure_alive(connection)
+                return operation(connection)
+            except Error as e:
+                if connection is not None and self._is_connection_error(e):
+                    # Forzar la verificación en el próximo uso
+                    self._last_used.pop(id(connection), None)
+                if intento == intentos or not self._is_connection_error(e):
+                    raise
+            finally:
+                self.checkin(connection)
+    
+    def _count_statement(self, evento):
+        """Incrementa un contador del registro de sentencias preparadas"""
+        with self._stats_lock:
+            self._statement_stats[evento] += 1
+    
+    def get_statement_stats(self):
+        """
+        Obtiene las estadísticas del registro de sentencias preparadas
+        
+        Returns:
+            dict: hits, misses, evictions y cantidad de sentencias registradas
+        """
+        with self._stats_lock:
+            stats = dict(self._statement_stats)
+        stats['cached'] = sum(len(registro) for registro in list(self._statements.values()))
+        return stats
+    
+    def _forget_statements(self, connection):
+        """Descarta las sentencias preparadas registradas para una conexión"""
+        registro = self._statements.pop(id(connection), None)
+        if not registro:
+            return
+        for cursor in registro.values():
+            try:
+                cursor.close()
+            except Error:
+                pass
+    
+    def _execute_statement(self, connection, query, params=None, dictionary=False):
+        """
+        Ejecuta una consulta y retorna el cursor con el resultado
+        
+        Con sentencias preparadas activas se reutiliza el cursor preparado
+        registrado para el mismo texto de consulta en esta conexión, de modo
+        que MySQL no vuelve a analizar ni planificar la sentencia.
+        
+        Returns:
+            cursor: Cursor listo para leer resultados
+        """
+        if not self.use_prepared:
+            cursor = connection.cursor(dictionary=dictionary)
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+            return cursor
+        
+        registro = self._statements.setdefault(id(connection), OrderedDict())
+        key = (query, dictionary)
+        cursor = registro.get(key)
+        if cursor is not None:
+            registro.move_to_end(key)
+            self._count_statement('hits')
+        else:
+            self._count_statement('misses')
+            cursor = connection.cursor(prepared=True, dictionary=dictionary)
+            registro[key] = cursor
+            if len(registro) > self.max_prepared_statements:
+                _, antiguo = registro.popitem(last=False)
+                self._count_statement('evictions')
+                try:
+                    antiguo.close()
+                except Error:
+                    pass
+        
+        try:
+            if params:
+                cursor.execute(query, params)
+            else:
+                cursor.execute(query)
+        except Error:
+            # La sentencia pudo quedar inválida; se volverá a preparar
+            registro.pop(key, None)
+            try:
+                cursor.close()
+            except Error:
+                pass
+            raise
+        return cursor
+    
+    def _release_cursor(self, cursor):
+        """Cierra el cursor salvo que pertenezca al registro de sentencias preparadas"""
+        if not self.use_prepared:
+            cursor.close()
+    
     def execute_query(self, query, params=None):
         """
         Ejecuta una consulta SQL (INSERT, UPDATE, DELETE)
@@ -52,19 +520,84 @@ class DatabaseConnection:
         Returns:
             tuple: (success, message/lastrowid)
         """
-        try:
-            cursor = self.connection.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            self.connection.commit()
+        def _execute(connection):
+            cursor = self._execute_statement(connection, query, params)
             lastrowid = cursor.lastrowid
-            cursor.close()
-            return True, lastrowid
+            self._release_cursor(cursor)
+            return lastrowid
+        
+        try:
+            # Las escrituras no se reintentan: no son idempotentes
+            return True, self._run(_execute, idempotent=False)
         except Error as e:
             return False, f"Error en la consulta: {str(e)}"
     
+    def execute_many(self, query, rows, chunk_size=500):
+        """
+        Ejecuta un INSERT para muchas filas en una sola transacción
+        
+        Si ya hay una transacción abierta en el hilo, las filas se suman a ella.
+        
+        Las filas se envían en bloques de chunk_size con executemany, que
+        genera un INSERT multi-fila por bloque. Si un bloque falla se
+        reintenta fila por fila (con SAVEPOINT) para reportar qué filas
+        fallaron sin descartar las demás.
+        
+        Args:
+            query: Consulta INSERT con un solo grupo VALUES (%s, ...)
+            rows: Lista de tuplas de parámetros
+            chunk_size: Cantidad de filas por bloque
+        
+        Returns:
+            tuple: (success, {'insertados': int, 'errores': [(indice, mensaje)]}/error_message)
+        """
+        chunk_size = max(1, int(chunk_size))
+        
+        def _execute(connection):
+            insertados = 0
+            errores = []
+            cursor = connection.cursor()
+            try:
+                for inicio in range(0, len(rows), chunk_size):
+                    bloque = rows[inicio:inicio + chunk_size]
+                    cursor.execute("SAVEPOINT bulk_bloque")
+                    try:
+                        cursor.executemany(query, bloque)
+                        insertados += len(bloque)
+                        continue
+                    except Error as e:
+                        if self._is_connection_error(e):
+                            raise
+                        cursor.execute("ROLLBACK TO SAVEPOINT bulk_bloque")
+                    
+                    # Aislar las filas con error dentro del bloque
+                    for offset, fila in enumerate(bloque):
+                        cursor.execute("SAVEPOINT bulk_fila")
+                        try:
+                            cursor.execute(query, fila)
+                            insertados += 1
+                        except Error as e:
+                            if self._is_connection_error(e):
+                                raise
+                            cursor.execute("ROLLBACK TO SAVEPOINT bulk_fila")
+                            errores.append((inicio + offset, str(e)))
+            finally:
+                cursor.close()
+            return {'insertados': insertados, 'errores': errores}
+        
+        if not rows:
+            return True, {'insertados': 0, 'errores': []}
+        
+        with self.transaction() as transaccion:
+            try:
+                result = self._run(_execute, idempotent=False)
+            except Error:
+                pass
+        
+        if not transaccion.success:
+            return False, f"Error en la inserción masiva: {transaccion.error}"
+        return True, result
+    
     def fetch_all(self, query, params=None):
         """
         Ejecuta una consulta SELECT y retorna todos los resultados
@@ -76,17 +609,62 @@ class DatabaseConnection:
         Returns:
             tuple: (success, results/error_message)
         """
+        def _fetch(connection):
+            cursor = self._execute_statement(connection, query, params, dictionary=True)
+            results = cursor.fetchall()
+            self._release_cursor(cursor)
+            return results
+        
         try:
-            cursor = self.connection.cursor(dictionary=True)
+            return True, self._run(_fetch, idempotent=True)
+        except Error as e:
+            return False, f"Error al obtener datos: {str(e)}"
+    
+    def fetch_iter(self, query, params=None, batch_size=500):
+        """
+        Ejecuta una consulta SELECT y entrega las filas de a poco
+        
+        Usa un cursor sin búfer y fetchmany(batch_size) sobre una conexión
+        dedicada (no la del hilo): el resultado nunca está completo en
+        memoria (solo un bloque a la vez, salvo que quien itera acumule las
+        filas) y se pueden hacer otras consultas mientras se itera. La conexión vuelve al pool al terminar; si el generador se
+        cierra o falla antes, le quedan filas sin leer y se descarta.
+        
+        Args:
+            query: Consulta SQL SELECT
+            params: Parámetros para la consulta (tupla)
+            batch_size: Filas leídas del servidor por cada fetchmany
+        
+        Yields:
+            dict: Cada fila del resultado
+        
+        Raises:
+            Error: Si la consulta falla
+        """
+        batch_size = max(1, int(batch_size))
+        connection = self._acquire()
+        reutilizable = False
+        try:
+            self._ensure_alive(connection)
+            cursor = connection.cursor(dictionary=True, buffered=False)
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
-            results = cursor.fetchall()
+            while True:
+                filas = cursor.fetchmany(batch_size)
+                if not filas:
+                    break
+                yield from filas
+            
+            # Solo una conexión sin resultados pendientes puede volver al pool
             cursor.close()
-            return True, results
-        except Error as e:
-            return False, f"Error al obtener datos: {str(e)}"
+            reutilizable = True
+        finally:
+            if reutilizable:
+                self._release(connection)
+            else:
+                self._discard(connection)
     
     def fetch_one(self, query, params=None):
         """
@@ -99,17 +677,42 @@ class DatabaseConnection:
         Returns:
             tuple: (success, result/error_message)
         """
-        try:
-            cursor = self.connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
+        def _fetch(connection):
+            cursor = self._execute_statement(connection, query, params, dictionary=True)
             result = cursor.fetchone()
-            cursor.close()
-            return True, result
+            if self.use_prepared:
+                # Consumir las filas restantes para poder reutilizar la sentencia
+                cursor.fetchall()
+            self._release_cursor(cursor)
+            return result
+        
+        try:
+            return True, self._run(_fetch, idempotent=True)
         except Error as e:
             return False, f"Error al obtener datos: {str(e)}"
+    
+    def has_index(self, table, index_name):
+        """
+        Indica si una tabla del esquema actual tiene el índice indicado
+        
+        El resultado se guarda en caché hasta la siguiente desconexión.
+        
+        Returns:
+            bool: True si el índice existe
+        """
+        key = (table, index_name)
+        if key not in self._indexes:
+            success, result = self.fetch_one(
+                """
+                SELECT COUNT(*) AS total FROM information_schema.STATISTICS
+                WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+                """,
+                (table, index_name)
+            )
+            if not success:
+                return False
+            self._indexes[key] = bool(result and result['total'])
+        return self._indexes[key]
 
 # Instancia global de la conexión
 db = DatabaseConnection()
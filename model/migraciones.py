@@ -0,0 +1,156 @@
+"""
+Migraciones versionadas del esquema de la base de datos
+Aplica en orden los scripts database/migrations/NNN_descripcion.sql
+y registra cada versión aplicada en la tabla schema_version
+
+Una sentencia precedida por la línea "-- opcional" puede fallar sin
+detener la migración (p. ej. funciones que MariaDB no soporta)
+"""
+import re
+from mysql.connector import Error, errorcode
+from model.conexion import db
+from utils.paths import path_manager
+
+class Migraciones:
+    """Ejecutor de migraciones del esquema"""
+    
+    # Errores que indican que el cambio ya existe (instalaciones parcialmente migradas)
+    _ERRORES_IGNORABLES = (
+        errorcode.ER_DUP_KEYNAME,
+        errorcode.ER_DUP_FIELDNAME,
+        errorcode.ER_TABLE_EXISTS_ERROR,
+    )
+    
+    @staticmethod
+    def directorio():
+        """Retorna el directorio de scripts de migración"""
+        return path_manager.database_dir / "migrations"
+    
+    @staticmethod
+    def obtener_scripts():
+        """
+        Lista los scripts de migración ordenados por versión
+        
+        Returns:
+            list: Tuplas (version, nombre, ruta)
+        """
+        scripts = []
+        directorio = Migraciones.directorio()
+        if not directorio.exists():
+            return scripts
+        
+        for ruta in directorio.glob("*.sql"):
+            match = re.match(r'^(\d+)_(.+)\.sql$', ruta.name)
+            if match:
+                scripts.append((int(match.group(1)), ruta.stem, ruta))
+        
+        return sorted(scripts)
+    
+    @staticmethod
+    def dividir_sentencias(sql):
+        """
+        Divide un script SQL en sentencias individuales (sin comentarios)
+        
+        Returns:
+            list: Tuplas (sentencia, opcional)
+        """
+        sentencias = []
+        actual = []
+        opcional = False
+        
+        for linea in sql.splitlines():
+            texto = linea.strip()
+            if not texto:
+                continue
+            if texto.startswith('--'):
+                if texto[2:].strip().lower() == 'opcional':
+                    opcional = True
+                continue
+            
+            actual.append(linea)
+            if texto.endswith(';'):
+                sentencia = "\n".join(actual).strip().rstrip(';').strip()
+                if sentencia:
+                    sentencias.append((sentencia, opcional))
+                actual = []
+                opcional = False
+        
+        resto = "\n".join(actual).strip()
+        if resto:
+            sentencias.append((resto, opcional))
+        return sentencias
+    
+    @staticmethod
+    def _ejecutar(cursor, sentencia, opcional=False):
+        """Ejecuta una sentencia ignorando los cambios que ya existen"""
+        try:
+            cursor.execute(sentencia)
+        except Error as e:
+            if e.errno in Migraciones._ERRORES_IGNORABLES:
+                return
+            if opcional:
+                print(f"⚠️ Sentencia opcional omitida: {str(e)}")
+                return
+            raise
+    
+    @staticmethod
+    def aplicar_pendientes():
+        """
+        Aplica las migraciones cuya versión aún no está registrada
+        
+        Returns:
+            tuple: (success, lista_de_migraciones_aplicadas/error_message)
+        """
+        aplicadas = []
+        connection = None
+        try:
+            connection = db.checkout()
+            cursor = connection.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_version (
+                    version INT PRIMARY KEY,
+                    nombre VARCHAR(255) NOT NULL,
+                    aplicado_en TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version")
+            version_actual = cursor.fetchone()[0]
+            
+            for version, nombre, ruta in Migraciones.obtener_scripts():
+                if version <= version_actual:
+                    continue
+                
+                # Las sentencias DDL de MySQL confirman solas; por eso cada
+                # sentencia tolera que su cambio ya exista si se reintenta
+                for sentencia, opcional in Migraciones.dividir_sentencias(ruta.read_text(encoding='utf-8')):
+                    Migraciones._ejecutar(cursor, sentencia, opcional)
+                
+                cursor.execute(
+                    "INSERT INTO schema_version (version, nombre) VALUES (%s, %s)",
+                    (version, nombre)
+                )
+                connection.commit()
+                aplicadas.append(nombre)
+            
+            cursor.close()
+            return True, aplicadas
+        except Error as e:
+            return False, f"Error al aplicar migraciones: {str(e)}"
+        except OSError as e:
+            return False, f"Error al leer migraciones: {str(e)}"
+        finally:
+            db.checkin(connection)
+
+if __name__ == "__main__":
+    success, result = db.connect()
+    if not success:
+        print(result)
+    else:
+        success, result = Migraciones.aplicar_pendientes()
+        if not success:
+            print(result)
+        elif result:
+            print("Migraciones aplicadas: " + ", ".join(result))
+        else:
+            print("El esquema ya está actualizado")
+        db.disconnect()
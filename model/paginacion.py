@@ -0,0 +1,79 @@
+"""
+Utilidades de paginación por llave (keyset / seek)
+Los cursores son tokens opacos con los valores de la última fila de la página
+"""
+import base64
+import json
+from datetime import date, datetime
+
+class Paginacion:
+    """Funciones auxiliares para paginar consultas sin OFFSET"""
+    
+    LIMITE_MAXIMO = 500
+    
+    @staticmethod
+    def _serializar(valor):
+        """Convierte un valor de columna a un tipo compatible con JSON"""
+        if isinstance(valor, datetime):
+            return valor.strftime("%Y-%m-%d %H:%M:%S.%f")
+        if isinstance(valor, date):
+            return valor.isoformat()
+        return valor
+    
+    @staticmethod
+    def codificar_cursor(fila, columnas):
+        """
+        Genera el token de cursor a partir de la última fila de una página
+        
+        Args:
+            fila (dict): Última fila devuelta
+            columnas (tuple): Columnas que forman la llave de orden
+        
+        Returns:
+            str: Token opaco para pedir la página siguiente
+        """
+        valores = [Paginacion._serializar(fila[col]) for col in columnas]
+        data = json.dumps(valores, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(data).decode()
+    
+    @staticmethod
+    def decodificar_cursor(token, cantidad):
+        """
+        Obtiene los valores de la llave guardados en un token
+        
+        Args:
+            token (str): Token generado por codificar_cursor
+            cantidad (int): Cantidad de columnas esperadas
+        
+        Returns:
+            list: Valores de la llave o None si el token es inválido
+        """
+        try:
+            valores = json.loads(base64.urlsafe_b64decode(token.encode()))
+        except (ValueError, TypeError, AttributeError):
+            return None
+        if not isinstance(valores, list) or len(valores) != cantidad:
+            return None
+        return valores
+    
+    @staticmethod
+    def normalizar_limite(limite):
+        """Acota el tamaño de página a un rango razonable"""
+        try:
+            limite = int(limite)
+        except (TypeError, ValueError):
+            limite = 50
+        return max(1, min(limite, Paginacion.LIMITE_MAXIMO))
+    
+    @staticmethod
+    def construir_pagina(filas, limite, columnas):
+        """
+        Arma el resultado de una página a partir de limite + 1 filas
+        
+        Returns:
+            dict: {'items': filas de la página, 'siguiente': token o None}
+        """
+        hay_mas = len(filas) > limite
+        items = filas[:limite]
+        siguiente = Paginacion.codificar_cursor(items[-1], columnas) if hay_mas else None
+        return {'items': items, 'siguiente': siguiente}
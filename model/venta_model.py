@@ -3,6 +3,7 @@ Modelo de datos para la tabla de ventas
 Implementa todas las operaciones CRUD
 """
 from model.conexion import db
+from model.paginacion import Paginacion
 
 class VentaModel:
     """Clase para gestionar operaciones CRUD de ventas"""
@@ -30,6 +31,25 @@ class VentaModel:
         
         return db.execute_query(query, params)
     
+    @staticmethod
+    def crear_ventas_bulk(ventas, chunk_size=500):
+        """
+        Crea varias ventas en una sola transacción usando INSERT multi-fila
+        
+        Args:
+            ventas: Lista de tuplas (id_auto, id_cliente, monto, metodo_pago, fecha_venta);
+                    si fecha_venta es None se usa la fecha actual
+            chunk_size: Cantidad de filas por sentencia INSERT
+        
+        Returns:
+            tuple: (success, {'insertados', 'errores': [(indice, mensaje)]}/error_message)
+        """
+        query = """
+            INSERT INTO ventas (id_auto, id_cliente, monto, metodo_pago, fecha_venta)
+            VALUES (%s, %s, %s, %s, COALESCE(%s, CURRENT_DATE))
+        """
+        return db.execute_many(query, ventas, chunk_size)
+    
     @staticmethod
     def obtener_todas():
         """
@@ -51,6 +71,62 @@ class VentaModel:
         """
         return db.fetch_all(query)
     
+    @staticmethod
+    def obtener_pagina(limite=50, cursor=None):
+        """
+        Obtiene una página de ventas ordenada por fecha de venta (más recientes primero)
+        
+        Usa paginación por llave sobre (fecha_venta, id_venta), por lo que el
+        costo de cada página no crece con el tamaño de la tabla.
+        
+        Args:
+            limite: Cantidad de ventas por página
+            cursor: Token 'siguiente' devuelto por la página anterior
+        
+        Returns:
+            tuple: (success, {'items', 'siguiente'}/error_message)
+        """
+        limite = Paginacion.normalizar_limite(limite)
+        columnas = ('fecha_venta', 'id_venta')
+        
+        if cursor:
+            llave = Paginacion.decodificar_cursor(cursor, len(columnas))
+            if llave is None:
+                return False, "Cursor de paginación inválido"
+            query = """
+                SELECT v.*, 
+                       a.marca as auto_marca, a.modelo as auto_modelo, 
+                       a.anio as auto_anio, a.color as auto_color, a.imagen as auto_imagen,
+                       c.nombre as cliente_nombre, c.telefono as cliente_telefono,
+                       c.correo as cliente_correo, c.direccion as cliente_direccion
+                FROM ventas v
+                INNER JOIN autos a ON v.id_auto = a.id_auto
+                INNER JOIN clientes c ON v.id_cliente = c.id_cliente
+                WHERE v.fecha_venta < %s OR (v.fecha_venta = %s AND v.id_venta < %s)
+                ORDER BY v.fecha_venta DESC, v.id_venta DESC
+                LIMIT %s
+            """
+            params = (llave[0], llave[0], llave[1], limite + 1)
+        else:
+            query = """
+                SELECT v.*, 
+                       a.marca as auto_marca, a.modelo as auto_modelo, 
+                       a.anio as auto_anio, a.color as auto_color, a.imagen as auto_imagen,
+                       c.nombre as cliente_nombre, c.telefono as cliente_telefono,
+                       c.correo as cliente_correo, c.direccion as cliente_direccion
+                FROM ventas v
+                INNER JOIN autos a ON v.id_auto = a.id_auto
+                INNER JOIN clientes c ON v.id_cliente = c.id_cliente
+                ORDER BY v.fecha_venta DESC, v.id_venta DESC
+                LIMIT %s
+            """
+            params = (limite + 1,)
+        
+        success, result = db.fetch_all(query, params)
+        if not success:
+            return False, result
+        return True, Paginacion.construir_pagina(result, limite, columnas)
+    
     @staticmethod
     def obtener_por_id(id_venta):
         """
@@ -1,12 +1,17 @@
 """
 Servicio para gestión de imágenes en Cloudinary
-Implementa subida, eliminación y obtención de URLs de imágenes
+Implementa subida (individual y por lotes), eliminación y obtención de URLs de imágenes
 """
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
+import cloudinary.exceptions
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import os
+import random
+import threading
+import time
 from dotenv import load_dotenv
 
 class CloudinaryService:
@@ -14,6 +19,18 @@ class CloudinaryService:
     
     _initialized = False
     
+    # Errores que no se corrigen reintentando (datos o credenciales inválidos)
+    _PERMANENT_ERRORS = (
+        cloudinary.exceptions.BadRequest,
+        cloudinary.exceptions.AuthorizationRequired,
+        cloudinary.exceptions.NotAllowed,
+        cloudinary.exceptions.NotFound
+    )
+    
+    # Espera base y máxima entre reintentos (segundos)
+    _RETRY_DELAY = 1.0
+    _RETRY_MAX_DELAY = 16.0
+    
     @staticmethod
     def initialize():
         """
@@ -70,25 +87,12 @@ class CloudinaryService:
         if not CloudinaryService.initialize():
             return False, "Error al inicializar Cloudinary", None
         
+        # Validar que el archivo existe
+        if not Path(image_path).exists():
+            return False, "El archivo de imagen no existe", None
+        
         try:
-            # Validar que el archivo existe
-            if not Path(image_path).exists():
-                return False, "El archivo de imagen no existe", None
-            
-            # Subir imagen con optimización de tamaño y calidad
-            result = cloudinary.uploader.upload(
-                image_path,
-                folder=folder,
-                resource_type="image",
-                transformation=[
-                    {'width': 600, 'height': 600, 'crop': 'limit'},
-                    {'quality': 'auto:eco'}  # Calidad más baja pero más rápida
-                ],
-                eager=[
-                    {'width': 50, 'height': 50, 'crop': 'fill', 'quality': 'auto:low'}  # Miniatura precargada
-                ],
-                eager_async=False  # Generar miniaturas inmediatamente
-            )
+            result = CloudinaryService._upload_with_retry(image_path, folder)
             
             # Extraer información
             url = result.get('secure_url')
@@ -99,6 +103,149 @@ class CloudinaryService:
         except Exception as e:
             return False, f"Error al subir imagen: {str(e)}", None
     
+    @staticmethod
+    def upload_batch(image_paths, folder="autos", on_progress=None, max_workers=None):
+        """
+        Sube varias imágenes en paralelo (importaciones masivas)
+        
+        Args:
+            image_paths (list): Rutas locales de las imágenes
+            folder (str): Carpeta en Cloudinary donde se guardarán
+            on_progress (function): Recibe un dict por cada cambio de estado de
+                                    un archivo: path, status ('subiendo',
+                                    'reintentando', 'ok' o 'error'), attempt,
+                                    url, public_id, error, completed y total.
+                                    Se llama desde los hilos de subida: para
+                                    tocar la interfaz usar dispatcher.post
+            max_workers (int): Subidas simultáneas
+                               (por defecto CLOUDINARY_UPLOAD_WORKERS o 4)
+        
+        Returns:
+            tuple: (success, resultado) donde success es True si todas se
+                   subieron y resultado es un dict con uploaded (lista de
+                   {path, url, public_id}), failed (lista de {path, error}),
+                   total y elapsed (segundos)
+        """
+        if not CloudinaryService.initialize():
+            return False, "Error al inicializar Cloudinary"
+        
+        if max_workers is None:
+            max_workers = int(os.getenv('CLOUDINARY_UPLOAD_WORKERS', 4))
+        
+        paths = [str(path) for path in image_paths]
+        total = len(paths)
+        uploaded = []
+        failed = []
+        lock = threading.Lock()
+        start = time.monotonic()
+        
+        def notify(path, status, attempt=1, url=None, public_id=None, error=None):
+            if on_progress is None:
+                return
+            with lock:
+                completed = len(uploaded) + len(failed)
+            try:
+                on_progress({
+                    'path': path,
+                    'status': status,
+                    'attempt': attempt,
+                    'url': url,
+                    'public_id': public_id,
+                    'error': error,
+                    'completed': completed,
+                    'total': total
+                })
+            except Exception as e:
+                print(f"⚠️ Error en el aviso de progreso de subida: {e}")
+        
+        def upload(path):
+            if not Path(path).exists():
+                raise FileNotFoundError("El archivo de imagen no existe")
+            notify(path, 'subiendo')
+            return CloudinaryService._upload_with_retry(
+                path, folder,
+                on_retry=lambda attempt, error: notify(path, 'reintentando', attempt, error=error)
+            )
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="cloudinary") as executor:
+            futures = {executor.submit(upload, path): path for path in paths}
+            
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    with lock:
+                        failed.append({'path': path, 'error': str(e)})
+                    notify(path, 'error', error=str(e))
+                    continue
+                
+                entry = {'path': path, 'url': result.get('secure_url'), 'public_id': result.get('public_id')}
+                with lock:
+                    uploaded.append(entry)
+                notify(path, 'ok', url=entry['url'], public_id=entry['public_id'])
+        
+        resultado = {
+            'uploaded': uploaded,
+            'failed': failed,
+            'total': total,
+            'elapsed': time.monotonic() - start
+        }
+        return not failed, resultado
+    
+    @staticmethod
+    def _upload(image_path, folder):
+        """Sube una imagen (un solo intento); lanza excepción si falla"""
+        # Subir imagen con optimización de tamaño y calidad
+        return cloudinary.uploader.upload(
+            image_path,
+            folder=folder,
+            resource_type="image",
+            transformation=[
+                {'width': 600, 'height': 600, 'crop': 'limit'},
+                {'quality': 'auto:eco'}  # Calidad más baja pero más rápida
+            ],
+            eager=[
+                {'width': 50, 'height': 50, 'crop': 'fill', 'quality': 'auto:low'}  # Miniatura precargada
+            ],
+            eager_async=True  # La miniatura se genera sin hacer esperar la subida
+        )
+    
+    @staticmethod
+    def _upload_with_retry(image_path, folder, on_retry=None):
+        """
+        Sube una imagen reintentando los errores transitorios (red, límites, 5xx)
+        
+        La espera crece de forma exponencial con un componente aleatorio
+        (jitter) para que las subidas paralelas no reintenten a la vez.
+        
+        Args:
+            image_path (str): Ruta local de la imagen
+            folder (str): Carpeta en Cloudinary
+            on_retry (function): on_retry(attempt, error) antes de cada reintento
+        
+        Returns:
+            dict: Respuesta de Cloudinary
+        
+        Raises:
+            Exception: El último error si se agotan los intentos
+        """
+        attempts = max(1, int(os.getenv('CLOUDINARY_UPLOAD_RETRIES', 3)))
+        delay = CloudinaryService._RETRY_DELAY
+        
+        for attempt in range(1, attempts + 1):
+            try:
+                return CloudinaryService._upload(image_path, folder)
+            except CloudinaryService._PERMANENT_ERRORS:
+                raise
+            except Exception as e:
+                if attempt == attempts:
+                    raise
+                if on_retry:
+                    on_retry(attempt + 1, str(e))
+                time.sleep(random.uniform(delay / 2, delay))
+                delay = min(delay * 2, CloudinaryService._RETRY_MAX_DELAY)
+    
     @staticmethod
     def delete_image(public_id):
         """
@@ -0,0 +1,73 @@
+"""
+Búsqueda con retardo (debounce) ejecutada en segundo plano
+Evita consultar la base de datos en el hilo de Tk en cada tecla
+"""
+from utils.ui_dispatcher import dispatcher
+
+class DebouncedSearch:
+    """Agrupa las teclas, consulta en un hilo de trabajo y descarta resultados obsoletos"""
+    
+    def __init__(self, widget, search_fn, on_result, delay_ms=300):
+        """
+        Args:
+            widget: Widget de Tk usado para programar callbacks con after()
+            search_fn (function): Consulta a ejecutar en segundo plano, recibe el criterio
+            on_result (function): Se llama en el hilo de Tk con el resultado más reciente
+            delay_ms (int): Tiempo sin teclear antes de lanzar la búsqueda
+        """
+        self.widget = widget
+        self.search_fn = search_fn
+        self.on_result = on_result
+        self.delay_ms = delay_ms
+        
+        self._after_id = None
+        self._generation = 0
+        self._last_criterio = None
+    
+    def schedule(self, criterio):
+        """Programa una búsqueda; cada llamada reinicia el retardo"""
+        if criterio == self._last_criterio:
+            return
+        self._last_criterio = criterio
+        self._cancel_timer()
+        self._after_id = self.widget.after(self.delay_ms, self._start, criterio)
+    
+    def cancel(self):
+        """Cancela la búsqueda pendiente y descarta las que estén en curso"""
+        self._cancel_timer()
+        self._generation += 1
+        self._last_criterio = None
+    
+    def _cancel_timer(self):
+        """Cancela el retardo pendiente, si existe"""
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+    
+    def _start(self, criterio):
+        """Lanza la búsqueda en un hilo de trabajo (hilo de Tk)"""
+        self._after_id = None
+        self._generation += 1
+        generation = self._generation
+        
+        # El resultado vuelve al hilo de Tk a través del despachador
+        dispatcher.run(
+            lambda: self.search_fn(criterio),
+            lambda resultado: self._deliver(generation, resultado),
+            widget=self.widget
+        )
+    
+    def _deliver(self, generation, resultado):
+        """Entrega el resultado si sigue siendo el más reciente (hilo de Tk)"""
+        if generation != self._generation:
+            return
+        
+        success, result = resultado
+        if not success:
+            # La tarea lanzó una excepción
+            result = (False, f"Error en la búsqueda: {result}")
+        
+        self.on_result(result)
@@ -0,0 +1,107 @@
+"""
+Caché de imágenes en memoria con presupuesto de bytes
+Descarta las imágenes usadas hace más tiempo (LRU) cuando se supera el límite
+"""
+import os
+import threading
+from collections import OrderedDict
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class ImageLRUCache:
+    """
+    Caché LRU de imágenes PIL limitado por memoria (ancho x alto x bandas)
+    
+    Las imágenes guardadas se tratan como de solo lectura: se entregan sin
+    copiar, por lo que quien las use no debe modificarlas.
+    """
+    
+    def __init__(self, max_bytes=None):
+        """
+        Args:
+            max_bytes (int): Presupuesto en bytes
+                             (por defecto IMAGE_MEMORY_CACHE_MB o 64 MB)
+        """
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('IMAGE_MEMORY_CACHE_MB', 64)) * 1024 * 1024)
+        
+        self.max_bytes = max_bytes
+        
+        self._entries = OrderedDict()  # clave -> (imagen, bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    
+    @staticmethod
+    def image_bytes(img):
+        """Memoria aproximada de una imagen sin comprimir"""
+        width, height = img.size
+        return width * height * len(img.getbands())
+    
+    def get(self, key):
+        """
+        Obtiene una imagen y la marca como usada recientemente
+        
+        Returns:
+            PIL.Image: Imagen (de solo lectura) o None si no está en caché
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[0]
+    
+    def __contains__(self, key):
+        """Indica si la clave está en caché (sin contar acierto ni fallo)"""
+        with self._lock:
+            return key in self._entries
+    
+    def put(self, key, img):
+        """Guarda una imagen y descarta las menos usadas si se supera el límite"""
+        size = self.image_bytes(img)
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            
+            self._entries[key] = (img, size)
+            self._bytes += size
+            
+            while self._bytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self._stats['evictions'] += 1
+    
+    def remove(self, key):
+        """Elimina una imagen del caché"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+    
+    def clear(self):
+        """Vacía el caché"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def get_stats(self):
+        """
+        Estadísticas de uso del caché
+        
+        Returns:
+            dict: hits, misses, evictions, entries, bytes y max_bytes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+            stats['max_bytes'] = self.max_bytes
+            return stats
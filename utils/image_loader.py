@@ -2,26 +2,193 @@
 Utilidad para cargar imágenes desde URLs (Cloudinary)
 Con optimizaciones de rendimiento: caché, URLs optimizadas y carga asíncrona
 """
-from PIL import Image
+from PIL import Image, ImageOps, ExifTags
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import BytesIO
-from pathlib import Path
 import hashlib
-from threading import Thread
+import threading
 from queue import Queue
+from utils.ui_dispatcher import dispatcher
+from utils.image_workers import image_pool
+from utils.thumbnail_cache import ThumbnailCache
+from utils.image_cache import ImageLRUCache
+from utils.photo_cache import photo_cache
+from utils.paths import path_manager
+
+class ImageRequest:
+    """
+    Solicitud de imagen de un llamador
+    
+    Varias solicitudes de la misma (url, tamaño) comparten una sola descarga;
+    cancelar una solo descarta su callback.
+    """
+    
+    def __init__(self, key, callback, priority):
+        self.key = key
+        self.callback = callback
+        self.priority = priority
+        self.cancelled = False
+        self.done = False
+    
+    def cancel(self):
+        """
+        Cancela la solicitud
+        
+        Returns:
+            bool: True si la descarga compartida se descartó antes de empezar
+        """
+        self.cancelled = True
+        return ImageLoader._cancel_request(self)
+    
+    def set_priority(self, priority):
+        """Cambia la prioridad (p. ej. cuando la fila entra o sale del área visible)"""
+        if priority != self.priority and not self.done:
+            self.priority = priority
+            ImageLoader._reschedule(self.key)
 
 class ImageLoader:
     """Clase para cargar y procesar imágenes con caché"""
     
-    # Caché en memoria para imágenes
-    _cache = {}
-    _cache_dir = Path("cache/images")
+    # Tamaño de las miniaturas de la tabla de autos
+    THUMBNAIL_SIZE = (50, 50)
+    
+    # Caché en memoria para imágenes (LRU con presupuesto de bytes)
+    _cache = ImageLRUCache()
+    _cache_dir = path_manager.root_dir / "cache" / "images"
+    
+    # Caché persistente en disco (sobrevive entre ejecuciones)
+    _disk_cache = ThumbnailCache(_cache_dir)
+    
+    # Sesión HTTP compartida (conexiones keep-alive reutilizadas)
+    _session = None
+    _session_lock = threading.Lock()
+    
+    # Descargas en curso: clave -> {'job', 'priority', 'url', 'size', 'requests'}
+    _in_flight = {}
+    _in_flight_lock = threading.Lock()
     
     @staticmethod
     def _init_cache():
         """Inicializa el directorio de caché"""
         ImageLoader._cache_dir.mkdir(parents=True, exist_ok=True)
     
+    @staticmethod
+    def invalidate(url, sizes=None):
+        """
+        Descarta una imagen del caché en memoria y en disco
+        
+        Se usa cuando la imagen de un auto cambia o se elimina (su
+        cloudinary_id deja de existir y la URL anterior ya no es válida).
+        
+        Args:
+            url (str): URL de la imagen anterior
+            sizes (list): Tamaños a descartar (por defecto el de las miniaturas)
+        """
+        if not url:
+            return
+        for size in sizes or [ImageLoader.THUMBNAIL_SIZE]:
+            cache_key = ImageLoader._get_cache_key(url, size)
+            ImageLoader._cache.remove(cache_key)
+            ImageLoader._disk_cache.remove(cache_key)
+        
+        # Las PhotoImage solo se tocan desde el hilo de Tk
+        dispatcher.post(photo_cache.discard, url)
+    
+    @staticmethod
+    def _get_session():
+        """
+        Sesión HTTP compartida por todos los hilos de carga
+        
+        El pool de conexiones se dimensiona al número de hilos de imágenes y
+        los errores 5xx transitorios se reintentan con espera exponencial.
+        """
+        if ImageLoader._session is not None:
+            return ImageLoader._session
+        
+        with ImageLoader._session_lock:
+            if ImageLoader._session is None:
+                retry = Retry(
+                    total=3,
+                    connect=2,
+                    backoff_factor=0.3,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset(["GET"])
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=2,
+                    pool_maxsize=image_pool.max_workers,
+                    max_retries=retry
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                ImageLoader._session = session
+        return ImageLoader._session
+    
+    @staticmethod
+    def get_cache_stats():
+        """Estadísticas del caché en memoria (aciertos, fallos, descartes, bytes)"""
+        stats = ImageLoader._cache.get_stats()
+        stats['photos'] = photo_cache.get_stats()
+        return stats
+    
+    @staticmethod
+    def _prepare(img):
+        """
+        Deja la imagen lista para mostrarse y compartirse entre hilos
+        
+        Fuerza la lectura de los píxeles y la convierte a RGB/RGBA, así el
+        caché puede entregarla sin copiar.
+        """
+        img.load()
+        if img.mode not in ("RGB", "RGBA"):
+            has_alpha = img.mode in ("LA", "PA") or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        return img
+    
+    @staticmethod
+    def _decode(source, size):
+        """
+        Abre una imagen y la lleva al tamaño pedido con el menor trabajo posible
+        
+        Los JPEG se decodifican ya reducidos (escala DCT con draft) y las
+        imágenes muy grandes se reducen primero con un promedio por bloques
+        rápido; LANCZOS solo se aplica sobre el último paso. La orientación
+        EXIF se corrige igual que al subir la imagen (ver ImageOptimizer).
+        
+        Args:
+            source: Ruta o archivo (BytesIO) con la imagen
+            size (tuple): Tamaño final (ancho, alto)
+        
+        Returns:
+            PIL.Image: Imagen redimensionada
+        """
+        img = Image.open(source)
+        
+        # Con orientación EXIF de 90° la imagen guardada tiene ancho y alto invertidos
+        orientation = img.getexif().get(ExifTags.Base.Orientation, 1)
+        stored = (size[1], size[0]) if orientation in (5, 6, 7, 8) else tuple(size)
+        if img.size == stored:
+            return ImageOps.exif_transpose(img)
+        
+        # Decodificar a no menos del doble del tamaño final conserva la nitidez
+        target = (stored[0] * 2, stored[1] * 2)
+        if img.format == "JPEG":
+            img.draft("RGB", target)
+        
+        factor = min(img.width // target[0], img.height // target[1])
+        if factor > 1:
+            # reduce no admite imágenes con paleta ni de 1 bit (PNG indexados, GIF)
+            if img.mode in ("P", "PA", "1"):
+                has_alpha = img.mode == "PA" or "transparency" in img.info
+                img = img.convert("RGBA" if has_alpha else "RGB")
+            img = img.reduce(factor)
+        
+        img = ImageOps.exif_transpose(img)
+        return img.resize(size, Image.Resampling.LANCZOS)
+    
     @staticmethod
     def _get_cache_key(url, size):
         """Genera una clave única para el caché"""
@@ -50,63 +217,193 @@ class ImageLoader:
         return url
     
     @staticmethod
-    def load_from_url_async(url, size, callback):
+    def load_from_url_async(url, size, callback, priority=0):
         """
         Carga una imagen de forma asíncrona y ejecuta un callback cuando termina
         
+        Si la misma imagen ya se está descargando, la solicitud se suma a esa
+        descarga en lugar de iniciar otra; al terminar se llaman todos los
+        callbacks con la misma imagen.
+        
         Args:
             url (str): URL de la imagen
             size (tuple): Tamaño deseado (ancho, alto)
             callback (function): Función a llamar con la imagen cargada
+                                 (se ejecuta en el hilo de Tk)
+            priority (int): Prioridad en la cola (0 = filas visibles)
+        
+        Returns:
+            ImageRequest: Solicitud; request.cancel() descarta su callback
         """
+        key = ImageLoader._get_cache_key(url, size)
+        request = ImageRequest(key, callback, priority)
+        
+        with ImageLoader._in_flight_lock:
+            flight = ImageLoader._in_flight.get(key)
+            if flight is None:
+                flight = {'job': None, 'priority': priority, 'url': url, 'size': size, 'requests': []}
+                ImageLoader._in_flight[key] = flight
+                flight['job'] = ImageLoader._submit_flight(key, url, size, priority)
+            flight['requests'].append(request)
+        
+        # Una fila visible que pide una imagen aún en espera la adelanta
+        ImageLoader._reschedule(key)
+        return request
+    
+    @staticmethod
+    def prefetch(url, size, priority=2):
+        """
+        Precarga una imagen en el caché sin mostrarla
+        
+        Args:
+            url (str): URL de la imagen
+            size (tuple): Tamaño deseado (ancho, alto)
+            priority (int): Prioridad en la cola (por defecto detrás de las
+                            filas visibles y de la siguiente pantalla)
+        
+        Returns:
+            ImageRequest: Solicitud (permite cancelarla), o None si la imagen
+                          ya está en memoria
+        """
+        if not url or ImageLoader._get_cache_key(url, size) in ImageLoader._cache:
+            return None
+        return ImageLoader.load_from_url_async(url, size, None, priority)
+    
+    @staticmethod
+    def _submit_flight(key, url, size, priority):
+        """Encola la descarga compartida de una clave"""
         def _load():
             img = ImageLoader.load_from_url(url, size, use_cache=True)
-            if callback:
-                callback(img)
+            
+            with ImageLoader._in_flight_lock:
+                flight = ImageLoader._in_flight.pop(key, None)
+            if flight is None:
+                return
+            
+            for request in flight['requests']:
+                request.done = True
+                if request.callback and not request.cancelled:
+                    # El callback crea widgets: nunca se llama desde este hilo
+                    dispatcher.post(request.callback, img)
+        
+        # Grupo acotado de hilos en lugar de un hilo por imagen
+        return image_pool.submit(_load, priority)
+    
+    @staticmethod
+    def _reschedule(key):
+        """
+        Ajusta la prioridad de una descarga compartida a la más urgente de
+        sus solicitudes
+        
+        Solo se reencola si aún no empezó; una vez en curso se deja terminar.
+        """
+        with ImageLoader._in_flight_lock:
+            flight = ImageLoader._in_flight.get(key)
+            if flight is None or not flight['requests']:
+                return
+            
+            priority = min(request.priority for request in flight['requests'])
+            if priority != flight['priority'] and flight['job'].cancel():
+                flight['priority'] = priority
+                flight['job'] = ImageLoader._submit_flight(key, flight['url'], flight['size'], priority)
+    
+    @staticmethod
+    def _cancel_request(request):
+        """
+        Retira una solicitud de su descarga compartida
         
-        thread = Thread(target=_load, daemon=True)
-        thread.start()
+        La descarga solo se cancela cuando ya no queda nadie esperándola.
+        """
+        with ImageLoader._in_flight_lock:
+            flight = ImageLoader._in_flight.get(request.key)
+            if flight is None or request not in flight['requests']:
+                return False
+            
+            flight['requests'].remove(request)
+            if not flight['requests']:
+                if not flight['job'].cancel():
+                    return False
+                del ImageLoader._in_flight[request.key]
+                return True
+        
+        # Quien queda puede tener menos prioridad que la solicitud retirada
+        ImageLoader._reschedule(request.key)
+        return False
+    
+    @staticmethod
+    def peek(url, size=(50, 50)):
+        """
+        Busca una imagen solo en el caché (memoria y disco), sin descargarla
+        
+        A diferencia de load_from_url nunca usa la red, por lo que puede
+        llamarse desde el hilo de Tk; los fallos deben resolverse con
+        load_from_url_async.
+        
+        Args:
+            url (str): URL de la imagen
+            size (tuple): Tamaño deseado (ancho, alto)
+        
+        Returns:
+            PIL.Image: Imagen del caché (no modificarla) o None si no está
+        """
+        if not url:
+            return None
+        
+        cache_key = ImageLoader._get_cache_key(url, size)
+        img = ImageLoader._cache.get(cache_key)
+        if img is not None:
+            return img
+        
+        # Miniatura ya descargada en otra ejecución (evita descargar en cada inicio)
+        img = ImageLoader._disk_cache.get(cache_key)
+        if img is not None:
+            img = ImageLoader._prepare(img)
+            ImageLoader._cache.put(cache_key, img)
+        return img
     
     @staticmethod
     def load_from_url(url, size=(50, 50), use_cache=True):
         """
         Carga una imagen desde una URL con caché y optimización
         
+        En un fallo de caché descarga la imagen (hasta varios segundos): desde
+        el hilo de Tk usar peek o load_from_url_async.
+        
         Args:
             url (str): URL de la imagen
             size (tuple): Tamaño deseado (ancho, alto)
-            use_cache (bool): Usar caché de memoria
+            use_cache (bool): Usar caché de memoria y de disco
             
         Returns:
-            PIL.Image: Imagen cargada y redimensionada o None si hay error
+            PIL.Image: Imagen cargada y redimensionada o None si hay error.
+                       Las imágenes del caché se comparten: no modificarlas.
         """
         if not url:
             return None
         
-        # Verificar caché en memoria
+        # Verificar caché en memoria y en disco
         if use_cache:
             cache_key = ImageLoader._get_cache_key(url, size)
-            if cache_key in ImageLoader._cache:
-                return ImageLoader._cache[cache_key].copy()
+            img = ImageLoader.peek(url, size)
+            if img is not None:
+                return img
         
         try:
             # Optimizar URL de Cloudinary para descargar imagen más pequeña
             optimized_url = ImageLoader._optimize_cloudinary_url(url, size[0], size[1])
             
-            # Descargar con timeout corto para no bloquear la UI
-            response = requests.get(optimized_url, timeout=3, stream=True)
-            response.raise_for_status()
+            # Descargar con timeout corto reutilizando conexiones abiertas
+            with ImageLoader._get_session().get(optimized_url, timeout=3) as response:
+                response.raise_for_status()
+                content = response.content
             
-            # Cargar imagen
-            img = Image.open(BytesIO(response.content))
-            
-            # Redimensionar solo si es necesario (Cloudinary ya lo hace)
-            if img.size != size:
-                img = img.resize(size, Image.Resampling.LANCZOS)
+            # Decodificar y redimensionar (solo si es necesario: Cloudinary ya lo hace)
+            img = ImageLoader._prepare(ImageLoader._decode(BytesIO(content), size))
             
             # Guardar en caché
             if use_cache:
-                ImageLoader._cache[cache_key] = img.copy()
+                ImageLoader._cache.put(cache_key, img)
+                ImageLoader._disk_cache.put(cache_key, img)
             
             return img
             
@@ -122,6 +419,9 @@ class ImageLoader:
         """
         Carga una imagen desde una ruta local
         
+        Decodifica la imagen completa: llamarla desde un hilo de trabajo
+        (ver load_from_path_async), nunca desde el hilo de Tk.
+        
         Args:
             path (str): Ruta local de la imagen
             size (tuple): Tamaño deseado (ancho, alto)
@@ -133,9 +433,24 @@ class ImageLoader:
             return None
         
         try:
-            img = Image.open(path)
-            img = img.resize(size, Image.Resampling.LANCZOS)
-            return img
+            return ImageLoader._prepare(ImageLoader._decode(path, size))
         except Exception as e:
             print(f"Error al cargar imagen desde ruta: {e}")
             return None
+    
+    @staticmethod
+    def load_from_path_async(path, size, callback, widget=None):
+        """
+        Carga una imagen local en segundo plano (fotos de cámara de varios MB)
+        
+        Args:
+            path (str): Ruta local de la imagen
+            size (tuple): Tamaño deseado (ancho, alto)
+            callback (function): Recibe la imagen (o None si hay error) en el hilo de Tk
+            widget: Widget dueño del callback; si ya no existe no se llama
+        """
+        dispatcher.run(
+            lambda: ImageLoader.load_from_path(path, size),
+            lambda resultado: callback(resultado[1] if resultado[0] else None),
+            widget=widget
+        )
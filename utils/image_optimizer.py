@@ -0,0 +1,110 @@
+"""
+Preparación de imágenes antes de subirlas a Cloudinary
+Corrige la orientación EXIF, reduce la foto al tamaño máximo configurado y la
+recomprime, para no enviar los originales de varios MB de las cámaras
+"""
+import os
+import tempfile
+from pathlib import Path
+from PIL import Image, ImageOps
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class ImageOptimizer:
+    """Optimización local de imágenes para subir"""
+    
+    # Formatos de salida admitidos -> extensión del archivo temporal
+    FORMATS = {'JPEG': ".jpg", 'WEBP': ".webp"}
+    
+    @staticmethod
+    def get_settings():
+        """
+        Configuración de la optimización desde variables de entorno
+        
+        Returns:
+            dict: max_size (lado máximo en píxeles, por defecto 600 como el
+                  límite que aplica Cloudinary), quality (1-95) y format
+                  (JPEG o WEBP)
+        """
+        image_format = os.getenv('UPLOAD_IMAGE_FORMAT', 'JPEG').upper()
+        if image_format not in ImageOptimizer.FORMATS:
+            print(f"⚠️ Formato de subida no soportado: {image_format}, se usa JPEG")
+            image_format = 'JPEG'
+        
+        return {
+            'max_size': int(os.getenv('UPLOAD_MAX_SIZE', 600)),
+            'quality': min(95, max(1, int(os.getenv('UPLOAD_IMAGE_QUALITY', 85)))),
+            'format': image_format
+        }
+    
+    @staticmethod
+    def optimize_for_upload(source_path, max_size=None, quality=None, image_format=None):
+        """
+        Genera una copia reducida y recomprimida de una imagen
+        
+        Args:
+            source_path (str): Ruta de la imagen original
+            max_size (int): Lado máximo en píxeles (se conserva la proporción)
+            quality (int): Calidad de compresión (1-95)
+            image_format (str): 'JPEG' o 'WEBP'
+        
+        Returns:
+            tuple: (success, ruta/error_message). La ruta es un archivo
+                   temporal que debe eliminar quien llama, o el original si
+                   la copia no resulta más liviana
+        """
+        settings = ImageOptimizer.get_settings()
+        max_size = max_size or settings['max_size']
+        quality = quality or settings['quality']
+        image_format = (image_format or settings['format']).upper()
+        
+        try:
+            img = Image.open(source_path)
+            
+            # Decodificar los JPEG ya reducidos (escala DCT) ahorra tiempo y memoria
+            if img.format == "JPEG":
+                img.draft("RGB", (max_size, max_size))
+            
+            # Las fotos de teléfono suelen venir giradas con una etiqueta EXIF
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS, reducing_gap=2.0)
+            img = ImageOptimizer._convert_mode(img, image_format)
+            
+            fd, tmp_name = tempfile.mkstemp(suffix=ImageOptimizer.FORMATS[image_format])
+            try:
+                with os.fdopen(fd, "wb") as tmp:
+                    if image_format == 'JPEG':
+                        img.save(tmp, format="JPEG", quality=quality, optimize=True, progressive=True)
+                    else:
+                        img.save(tmp, format="WEBP", quality=quality, method=4)
+            except Exception:
+                os.remove(tmp_name)
+                raise
+            
+            # Una imagen ya pequeña y bien comprimida se sube tal cual
+            if os.path.getsize(tmp_name) >= Path(source_path).stat().st_size:
+                os.remove(tmp_name)
+                return True, str(source_path)
+            
+            return True, tmp_name
+        
+        except Exception as e:
+            return False, f"Error al optimizar imagen: {str(e)}"
+    
+    @staticmethod
+    def _convert_mode(img, image_format):
+        """Convierte la imagen a un modo que admita el formato de salida"""
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        
+        if image_format == 'WEBP':
+            return img.convert("RGBA" if has_alpha else "RGB")
+        
+        if not has_alpha:
+            return img.convert("RGB") if img.mode != "RGB" else img
+        
+        # JPEG no admite transparencia: se compone sobre fondo blanco
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        return background
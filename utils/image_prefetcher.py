@@ -0,0 +1,145 @@
+"""
+Precarga de miniaturas guiada por el área visible de una tabla
+Adelanta la siguiente pantalla en la dirección del desplazamiento, descarta
+lo que quedó atrás y calienta el caché cuando la interfaz está inactiva
+"""
+from utils.image_loader import ImageLoader
+from utils.image_workers import image_pool
+
+class ImagePrefetcher:
+    """
+    Precarga las imágenes de los registros cercanos al área visible
+    
+    Solo debe usarse desde el hilo de Tk. Prioridades usadas en la cola de
+    imágenes: 0 = filas visibles, 1 = siguiente pantalla, 2 = resto.
+    """
+    
+    VISIBLE = 0
+    AHEAD = 1
+    BACKGROUND = 2
+    
+    # Espera antes de reintentar el calentamiento si los hilos están ocupados
+    IDLE_RETRY_MS = 250
+    
+    def __init__(self, widget, get_url, size, screens_ahead=1, idle_screens=4, idle_batch=4):
+        """
+        Args:
+            widget: Widget cuyo after_idle se usa para el calentamiento
+            get_url (function): Obtiene la URL de la imagen de un registro
+            size (tuple): Tamaño de las imágenes (ancho, alto)
+            screens_ahead (int): Pantallas que se precargan en la dirección
+                                 del desplazamiento
+            idle_screens (int): Pantallas adicionales que se calientan cuando
+                                la interfaz está inactiva
+            idle_batch (int): Imágenes encoladas en cada paso de calentamiento
+        """
+        self.widget = widget
+        self.get_url = get_url
+        self.size = size
+        self.screens_ahead = screens_ahead
+        self.idle_screens = idle_screens
+        self.idle_batch = idle_batch
+        
+        self._items = []
+        self._first = 0
+        self._last = -1
+        self._direction = 1  # 1 = hacia abajo, -1 = hacia arriba
+        self._requests = {}  # url -> ImageRequest de precarga
+        self._idle_indexes = []
+        self._idle_id = None
+    
+    def update_viewport(self, items, first, last):
+        """
+        Registra el área visible y ajusta las precargas
+        
+        Args:
+            items (list): Registros de la tabla
+            first (int): Primer índice visible
+            last (int): Último índice visible
+        """
+        if first != self._first:
+            self._direction = 1 if first > self._first else -1
+        self._items = items
+        self._first = first
+        self._last = last
+        
+        span = max(1, last - first + 1)
+        ahead = self._indexes_ahead(span * self.screens_ahead)
+        idle = self._indexes_ahead(span * (self.screens_ahead + self.idle_screens))[len(ahead):]
+        
+        wanted = []
+        for index in ahead:
+            url = self.get_url(items[index])
+            if url and url not in wanted:
+                wanted.append(url)
+        
+        # Lo que quedó atrás (o ya terminó) deja de ocupar la cola
+        for url, request in list(self._requests.items()):
+            if request.done or url not in wanted:
+                request.cancel()
+                del self._requests[url]
+        
+        for url in wanted:
+            if url not in self._requests:
+                self._prefetch(url, self.AHEAD)
+        
+        self._idle_indexes = idle
+        self._schedule_idle()
+    
+    def priority_for(self, index):
+        """Prioridad para la imagen de un índice según el área visible y la dirección"""
+        if self._first <= index <= self._last:
+            return self.VISIBLE
+        ahead = index > self._last if self._direction > 0 else index < self._first
+        return self.AHEAD if ahead else self.BACKGROUND
+    
+    def cancel(self):
+        """Cancela las precargas y el calentamiento pendiente"""
+        if self._idle_id is not None:
+            self.widget.after_cancel(self._idle_id)
+            self._idle_id = None
+        for request in self._requests.values():
+            request.cancel()
+        self._requests.clear()
+        self._idle_indexes = []
+    
+    def _indexes_ahead(self, count):
+        """Índices siguientes al área visible en la dirección del desplazamiento"""
+        if self._direction > 0:
+            return list(range(self._last + 1, min(len(self._items), self._last + 1 + count)))
+        return list(range(self._first - 1, max(-1, self._first - 1 - count), -1))
+    
+    def _prefetch(self, url, priority):
+        """Encola la precarga de una URL (si no está ya en memoria)"""
+        request = ImageLoader.prefetch(url, self.size, priority)
+        if request is not None:
+            self._requests[url] = request
+    
+    def _schedule_idle(self):
+        """Programa el siguiente paso de calentamiento para cuando Tk esté inactivo"""
+        if self._idle_id is not None:
+            self.widget.after_cancel(self._idle_id)
+            self._idle_id = None
+        if self._idle_indexes:
+            self._idle_id = self.widget.after_idle(self._warm_idle)
+    
+    def _warm_idle(self):
+        """Encola unas pocas imágenes más allá de la siguiente pantalla"""
+        self._idle_id = None
+        
+        # Con los hilos ocupados, el calentamiento solo competiría con lo visible
+        if image_pool.pending() >= image_pool.max_workers:
+            self._idle_id = self.widget.after(self.IDLE_RETRY_MS, self._schedule_idle)
+            return
+        
+        queued = 0
+        while self._idle_indexes and queued < self.idle_batch:
+            index = self._idle_indexes.pop(0)
+            if index >= len(self._items):
+                continue
+            url = self.get_url(self._items[index])
+            if url and url not in self._requests:
+                self._prefetch(url, self.BACKGROUND)
+                queued += 1
+        
+        self._schedule_idle()
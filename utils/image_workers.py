@@ -0,0 +1,95 @@
+"""
+Grupo acotado de hilos para la carga de imágenes
+Reemplaza un hilo por imagen por una cola con prioridad atendida por un
+número fijo de hilos (configurable con IMAGE_WORKERS)
+"""
+import itertools
+import os
+import queue
+import threading
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class ImageJob:
+    """Tarea encolada; se puede cancelar mientras no haya empezado"""
+    
+    def __init__(self, fn, priority):
+        self.fn = fn
+        self.priority = priority
+        self.cancelled = False
+        self.started = False
+    
+    def cancel(self):
+        """
+        Cancela la tarea
+        
+        Returns:
+            bool: True si la tarea aún no había empezado
+        """
+        self.cancelled = True
+        return not self.started
+
+class ImageWorkerPool:
+    """Hilos compartidos que atienden las tareas por prioridad (menor = antes)"""
+    
+    def __init__(self, max_workers=None):
+        """
+        Args:
+            max_workers (int): Máximo de descargas simultáneas
+                               (por defecto IMAGE_WORKERS o 4)
+        """
+        self.max_workers = max(1, int(max_workers or os.getenv('IMAGE_WORKERS', 4)))
+        
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()  # Desempate FIFO entre iguales
+        self._threads = []
+        self._lock = threading.Lock()
+    
+    def submit(self, fn, priority=0):
+        """
+        Encola una tarea
+        
+        Args:
+            fn (function): Tarea sin argumentos
+            priority (int): Prioridad (0 = filas visibles)
+        
+        Returns:
+            ImageJob: Tarea encolada (permite cancelarla)
+        """
+        job = ImageJob(fn, priority)
+        self._queue.put((priority, next(self._sequence), job))
+        self._ensure_workers()
+        return job
+    
+    def pending(self):
+        """Cantidad aproximada de tareas en espera"""
+        return self._queue.qsize()
+    
+    def _ensure_workers(self):
+        """Inicia los hilos la primera vez que se necesitan"""
+        with self._lock:
+            while len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"imagenes_{len(self._threads)}",
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+    
+    def _worker(self):
+        """Atiende la cola indefinidamente"""
+        while True:
+            _, _, job = self._queue.get()
+            if job.cancelled:
+                continue
+            
+            job.started = True
+            try:
+                job.fn()
+            except Exception as e:
+                print(f"⚠️ Error al cargar imagen: {e}")
+
+# Instancia global compartida por toda la aplicación
+image_pool = ImageWorkerPool()
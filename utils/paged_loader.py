@@ -0,0 +1,95 @@
+"""
+Carga por páginas de una lista a medida que se desplaza la tabla
+Pide la página siguiente (paginación por llave) en un hilo de trabajo cuando
+el área visible se acerca al final de lo ya cargado
+"""
+from utils.ui_dispatcher import dispatcher
+
+class PagedLoader:
+    """Carga páginas bajo demanda y descarta las respuestas de cargas anteriores"""
+    
+    def __init__(self, widget, fetch_page, on_page, page_size=100, threshold=None):
+        """
+        Args:
+            widget: Widget dueño de los callbacks (si se destruye no se llaman)
+            fetch_page (function): fetch_page(limite, cursor) retorna
+                                   (success, {'items', 'siguiente'}/error_message);
+                                   se ejecuta en un hilo de trabajo
+            on_page (function): on_page(resultado, first) en el hilo de Tk, con
+                                resultado = (success, items/error_message) y
+                                first = True para la primera página
+            page_size (int): Registros por página
+            threshold (int): Filas restantes bajo las cuales se pide la página
+                             siguiente (por defecto media página)
+        """
+        self.widget = widget
+        self.fetch_page = fetch_page
+        self.on_page = on_page
+        self.page_size = page_size
+        self.threshold = page_size // 2 if threshold is None else threshold
+        
+        self._generation = 0
+        self._cursor = None
+        self._loaded = 0
+        self._loading = False
+        self._complete = True
+    
+    @property
+    def complete(self):
+        """Indica si ya no quedan páginas por cargar"""
+        return self._complete
+    
+    def reset(self):
+        """Descarta lo cargado y pide la primera página"""
+        self._generation += 1
+        self._cursor = None
+        self._loaded = 0
+        self._complete = False
+        self._load()
+    
+    def stop(self):
+        """Deja de cargar páginas (p. ej. mientras se muestra una búsqueda)"""
+        self._generation += 1
+        self._loading = False
+        self._complete = True
+    
+    def on_viewport(self, first, last):
+        """Pide la página siguiente si el área visible se acerca al final"""
+        if self._complete or self._loading:
+            return
+        if last >= self._loaded - self.threshold:
+            self._load()
+    
+    def _load(self):
+        """Pide la página que sigue al cursor actual en un hilo de trabajo"""
+        self._loading = True
+        generation = self._generation
+        cursor = self._cursor
+        
+        dispatcher.run(
+            lambda: self.fetch_page(self.page_size, cursor),
+            lambda resultado: self._deliver(generation, cursor is None, resultado),
+            widget=self.widget
+        )
+    
+    def _deliver(self, generation, first, resultado):
+        """Entrega la página si corresponde a la carga actual (hilo de Tk)"""
+        if generation != self._generation:
+            return
+        self._loading = False
+        
+        success, result = resultado
+        if not success:
+            # La tarea lanzó una excepción
+            result = (False, f"Error al cargar datos: {result}")
+        
+        success, result = result
+        if not success:
+            self._complete = True
+            self.on_page((False, result), first)
+            return
+        
+        self._cursor = result['siguiente']
+        self._complete = self._cursor is None
+        self._loaded += len(result['items'])
+        self.on_page((True, result['items']), first)
@@ -0,0 +1,111 @@
+"""
+Caché de imágenes listas para Tk (PhotoImage)
+Convertir una imagen PIL a PhotoImage copia todos los píxeles en el hilo de
+Tk; este caché reutiliza la misma PhotoImage mientras algún widget la use
+"""
+from collections import OrderedDict
+from PIL import ImageTk
+
+class PhotoCache:
+    """
+    PhotoImage compartidas por (url, tamaño) con conteo de referencias
+    
+    Solo debe usarse desde el hilo de Tk. Las imágenes que ningún widget usa
+    se conservan un tiempo (hasta max_unused) para que volver a dibujar la
+    tabla tras una búsqueda no requiera convertir nada.
+    """
+    
+    def __init__(self, max_unused=200):
+        """
+        Args:
+            max_unused (int): Máximo de PhotoImage sin uso que se conservan
+        """
+        self.max_unused = max_unused
+        
+        self._photos = {}  # (url, tamaño) -> [PhotoImage, referencias]
+        self._unused = OrderedDict()  # Claves sin referencias, de la más antigua a la más reciente
+        self._stats = {'hits': 0, 'conversions': 0, 'released': 0}
+    
+    def acquire(self, url, size, image=None):
+        """
+        Obtiene la PhotoImage de una imagen y registra un uso
+        
+        Args:
+            url (str): URL de la imagen
+            size (tuple): Tamaño (ancho, alto)
+            image (PIL.Image): Imagen a convertir si aún no está en caché
+        
+        Returns:
+            PhotoImage: Imagen lista para un widget, o None si no está en
+                        caché y no se indicó image
+        """
+        key = (url, tuple(size))
+        entry = self._photos.get(key)
+        
+        if entry is not None:
+            entry[1] += 1
+            self._unused.pop(key, None)
+            self._stats['hits'] += 1
+            return entry[0]
+        
+        if image is None:
+            return None
+        
+        photo = ImageTk.PhotoImage(image)
+        self._photos[key] = [photo, 1]
+        self._stats['conversions'] += 1
+        return photo
+    
+    def release(self, url, size, photo):
+        """
+        Registra que un widget dejó de usar la imagen
+        
+        Args:
+            url (str): URL de la imagen
+            size (tuple): Tamaño (ancho, alto)
+            photo (PhotoImage): La imagen que obtuvo con acquire; si la
+                                entrada fue descartada (discard) y ya hay otra
+                                para la misma clave, la liberación se ignora
+        """
+        key = (url, tuple(size))
+        entry = self._photos.get(key)
+        if entry is None or entry[0] is not photo or entry[1] == 0:
+            return
+        
+        entry[1] -= 1
+        if entry[1] == 0:
+            self._unused[key] = None
+            self._trim()
+    
+    def discard(self, url):
+        """
+        Olvida todas las PhotoImage de una URL (imagen reemplazada o eliminada)
+        
+        Los widgets que aún la muestran conservan su propia referencia; su
+        release posterior no afecta a la entrada nueva de la misma clave.
+        """
+        for key in [key for key in self._photos if key[0] == url]:
+            del self._photos[key]
+            self._unused.pop(key, None)
+    
+    def get_stats(self):
+        """
+        Estadísticas del caché
+        
+        Returns:
+            dict: hits, conversions, released, entries y unused
+        """
+        stats = dict(self._stats)
+        stats['entries'] = len(self._photos)
+        stats['unused'] = len(self._unused)
+        return stats
+    
+    def _trim(self):
+        """Libera las PhotoImage sin uso más antiguas por encima del límite"""
+        while len(self._unused) > self.max_unused:
+            key, _ = self._unused.popitem(last=False)
+            self._photos.pop(key, None)
+            self._stats['released'] += 1
+
+# Instancia global (hilo de Tk)
+photo_cache = PhotoCache()
@@ -25,6 +25,9 @@ except ImportError:
 class PDFGenerator:
     """Generador de documentos PDF para la aplicación"""
     
+    # Filas por tabla en reportes de listas
+    CLIENTES_POR_TABLA = 200
+    
     def __init__(self):
         self.styles = getSampleStyleSheet()
         self._create_custom_styles()
@@ -138,7 +141,11 @@ class PDFGenerator:
         
         Args:
             output_filename: Nombre del archivo de salida
-            clientes_data: Lista de clientes (opcional, si no se provee se obtiene del controlador)
+            clientes_data: Lista o iterador de clientes (opcional, si no se provee se obtiene del controlador)
+        
+        Con un iterador la consulta no se carga completa de una vez, pero las
+        tablas del documento se arman antes de doc.build: la memoria del
+        reporte sigue creciendo con la cantidad de clientes.
         """
         output_path = path_manager.get_output_path(output_filename)
         doc = SimpleDocTemplate(output_path, pagesize=letter)
@@ -153,58 +160,43 @@ class PDFGenerator:
         story.append(subtitle)
         story.append(Spacer(1, 0.3*inch))
         
-        # Usar clientes proporcionados o lista vacía
+        # Usar clientes proporcionados (lista o iterador) o lista vacía
         clientes = clientes_data if clientes_data is not None else []
         
-        if not clientes:
+        # Se reserva la posición del encabezado: el total se conoce al terminar de iterar
+        heading_index = len(story)
+        total = 0
+        
+        # Las filas se agrupan en tablas de CLIENTES_POR_TABLA para no tener que
+        # dividir una sola tabla enorme entre páginas (costo cuadrático)
+        data = [['ID', 'Nombre', 'Teléfono', 'Correo', 'Dirección']]
+        primera_tabla = True
+        
+        for cliente in clientes:
+            data.append([
+                str(cliente.get('id_cliente', '')),
+                f"{cliente.get('nombre', '')} {cliente.get('apellido', '')}",
+                cliente.get('telefono', 'N/A'),
+                cliente.get('correo', 'N/A'),
+                cliente.get('direccion', 'N/A')
+            ])
+            total += 1
+            
+            if len(data) >= self.CLIENTES_POR_TABLA:
+                story.append(self._crear_tabla_clientes(data, primera_tabla))
+                primera_tabla = False
+                data = []
+        
+        if total > 0 and data:
+            story.append(self._crear_tabla_clientes(data, primera_tabla))
+        
+        if total == 0:
             no_data = Paragraph("No hay clientes registrados", self.styles['Normal'])
-            story.append(no_data)
+            story.insert(heading_index, no_data)
         else:
             # Información de clientes en tabla
-            heading = Paragraph(f"Total de clientes: {len(clientes)}", self.styles['CustomHeading'])
-            story.append(heading)
-            
-            # Encabezados de tabla
-            data = [['ID', 'Nombre', 'Teléfono', 'Correo', 'Dirección']]
-            
-            # Agregar datos de clientes
-            for cliente in clientes:
-                data.append([
-                    str(cliente.get('id_cliente', '')),
-                    f"{cliente.get('nombre', '')} {cliente.get('apellido', '')}",
-                    cliente.get('telefono', 'N/A'),
-                    cliente.get('correo', 'N/A'),
-                    cliente.get('direccion', 'N/A')
-                ])
-            
-            # Crear tabla
-            table = Table(data, colWidths=[0.5*inch, 1.8*inch, 1.3*inch, 1.8*inch, 1.8*inch])
-            table.setStyle(TableStyle([
-                # Encabezado
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3B82F6')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('TOPPADDING', (0, 0), (-1, 0), 12),
-                
-                # Datos
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#1F2937')),
-                ('ALIGN', (0, 1), (0, -1), 'CENTER'),  # ID centrado
-                ('ALIGN', (1, 1), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-                ('TOPPADDING', (0, 1), (-1, -1), 8),
-                
-                # Bordes y rayas
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F9FAFB')])
-            ]))
-            
-            story.append(table)
+            heading = Paragraph(f"Total de clientes: {total}", self.styles['CustomHeading'])
+            story.insert(heading_index, heading)
         
         story.append(Spacer(1, 0.5*inch))
         
@@ -218,6 +210,49 @@ class PDFGenerator:
         doc.build(story)
         return output_path
     
+    def _crear_tabla_clientes(self, data, con_encabezado):
+        """
+        Crea una tabla de la lista de clientes
+        
+        Args:
+            data: Filas de la tabla
+            con_encabezado: Si la primera fila es la de encabezados
+        """
+        table = Table(data, colWidths=[0.5*inch, 1.8*inch, 1.3*inch, 1.8*inch, 1.8*inch])
+        inicio = 1 if con_encabezado else 0
+        estilo = []
+        
+        if con_encabezado:
+            estilo += [
+                # Encabezado
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3B82F6')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                ('TOPPADDING', (0, 0), (-1, 0), 12),
+            ]
+        
+        estilo += [
+            # Datos
+            ('BACKGROUND', (0, inicio), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, inicio), (-1, -1), colors.HexColor('#1F2937')),
+            ('ALIGN', (0, inicio), (0, -1), 'CENTER'),  # ID centrado
+            ('ALIGN', (1, inicio), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, inicio), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, inicio), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, inicio), (-1, -1), 8),
+            ('TOPPADDING', (0, inicio), (-1, -1), 8),
+            
+            # Bordes y rayas
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
+            ('ROWBACKGROUNDS', (0, inicio), (-1, -1), [colors.white, colors.HexColor('#F9FAFB')])
+        ]
+        
+        table.setStyle(TableStyle(estilo))
+        return table
+    
     def generate_venta_report(self, venta_data, output_filename):
         """
         Genera un reporte PDF de una venta
@@ -0,0 +1,169 @@
+"""
+Caché persistente de miniaturas en disco
+Cada miniatura se guarda con su clave de caché como nombre de archivo, con
+escrituras atómicas y un tamaño máximo que se respeta descartando las menos
+usadas recientemente
+"""
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from PIL import Image
+from dotenv import load_dotenv
+
+load_dotenv()
+
+class ThumbnailCache:
+    """Caché de miniaturas en disco con límite de tamaño (LRU por fecha de uso)"""
+    
+    # Cambiar la versión invalida todo el caché anterior (p. ej. al cambiar el formato)
+    VERSION = 1
+    
+    def __init__(self, directory, max_bytes=None):
+        """
+        Args:
+            directory (Path): Directorio base del caché
+            max_bytes (int): Tamaño máximo en bytes
+                             (por defecto IMAGE_DISK_CACHE_MB o 100 MB)
+        """
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('IMAGE_DISK_CACHE_MB', 100)) * 1024 * 1024)
+        
+        self.base_dir = Path(directory)
+        self.directory = self.base_dir / f"v{self.VERSION}"
+        self.max_bytes = max_bytes
+        
+        self._lock = threading.Lock()
+        self._total_bytes = None  # Se calcula la primera vez que se escribe
+        self._ready = False
+    
+    def _init_directory(self):
+        """Crea el directorio y elimina las versiones anteriores del caché"""
+        if self._ready:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for entry in self.base_dir.iterdir():
+            if entry.is_dir() and entry != self.directory and entry.name.startswith("v"):
+                shutil.rmtree(entry, ignore_errors=True)
+        self._ready = True
+    
+    def _path(self, key):
+        """Ruta del archivo para una clave (subdirectorio por prefijo)"""
+        return self.directory / key[:2] / f"{key}.png"
+    
+    def get(self, key):
+        """
+        Lee una miniatura del disco
+        
+        Returns:
+            PIL.Image: Miniatura cargada o None si no está en caché
+        """
+        path = self._path(key)
+        try:
+            img = Image.open(path)
+            img.load()
+        except (OSError, ValueError):
+            return None
+        
+        # Marcar como usada recientemente para el descarte LRU
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return img
+    
+    def contains(self, key):
+        """Indica si la clave está en disco (sin leer la imagen)"""
+        return self._path(key).exists()
+    
+    def put(self, key, img):
+        """
+        Guarda una miniatura en disco de forma atómica
+        
+        Se escribe en un archivo temporal del mismo directorio y luego se
+        renombra, así un lector nunca ve un archivo a medio escribir.
+        """
+        try:
+            with self._lock:
+                self._init_directory()
+            
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # PNG no admite algunos modos (p. ej. CMYK de ciertos JPEG)
+            if img.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+                img = img.convert("RGB")
+            
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp:
+                    img.save(tmp, format="PNG", optimize=True)
+                previous = path.stat().st_size if path.exists() else 0
+                os.replace(tmp_name, path)
+            except Exception:
+                if os.path.exists(tmp_name):
+                    os.remove(tmp_name)
+                raise
+            
+            with self._lock:
+                if self._total_bytes is None:
+                    self._total_bytes = self._scan_size()
+                else:
+                    self._total_bytes += path.stat().st_size - previous
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        except Exception as e:
+            print(f"⚠️ No se pudo guardar la miniatura en caché: {e}")
+    
+    def remove(self, key):
+        """Elimina una miniatura del disco"""
+        path = self._path(key)
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes -= size
+    
+    def _files(self):
+        """Archivos del caché actual"""
+        if not self.directory.exists():
+            return []
+        return [path for path in self.directory.glob("*/*.png") if path.is_file()]
+    
+    def _scan_size(self):
+        """Calcula el tamaño total del caché en disco"""
+        total = 0
+        for path in self._files():
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+    
+    def _evict(self):
+        """Descarta las miniaturas menos usadas hasta quedar en el 90% del límite"""
+        entries = []
+        for path in self._files():
+            try:
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+            except OSError:
+                pass
+        entries.sort()
+        
+        target = int(self.max_bytes * 0.9)
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+        
+        self._total_bytes = total
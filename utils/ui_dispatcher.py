@@ -0,0 +1,133 @@
+"""
+Despachador de callbacks hacia el hilo de Tk
+Tk no es seguro entre hilos: los hilos de trabajo dejan sus resultados en una
+cola y un ciclo con after() en la ventana principal los ejecuta por lotes
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class UIDispatcher:
+    """Cola segura entre hilos drenada periódicamente desde el hilo de Tk"""
+    
+    def __init__(self, interval_ms=16, max_batch=500, max_workers=4):
+        """
+        Args:
+            interval_ms (int): Intervalo del ciclo que drena la cola
+            max_batch (int): Máximo de callbacks ejecutados por ciclo
+            max_workers (int): Hilos para tareas enviadas con run()
+        """
+        self.interval_ms = interval_ms
+        self.max_batch = max_batch
+        self.max_workers = max_workers
+        
+        self._queue = queue.SimpleQueue()
+        self._root = None
+        self._after_id = None
+        self._ui_thread = None
+        self._executor = None
+        self._lock = threading.Lock()
+    
+    def install(self, root):
+        """
+        Inicia el ciclo de despacho sobre la ventana principal
+        
+        Args:
+            root: Ventana principal de Tk (MainApplication)
+        """
+        self._root = root
+        self._ui_thread = threading.current_thread()
+        if self._after_id is None:
+            self._after_id = root.after(self.interval_ms, self._pump)
+    
+    def shutdown(self):
+        """Detiene el ciclo de despacho y descarta los callbacks pendientes"""
+        if self._root is not None and self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+        self._after_id = None
+        self._root = None
+        
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+    
+    def is_ui_thread(self):
+        """Indica si el hilo actual es el hilo de Tk"""
+        return threading.current_thread() is self._ui_thread
+    
+    def post(self, callback, *args, widget=None):
+        """
+        Encola un callback para ejecutarlo en el hilo de Tk
+        
+        Se puede llamar desde cualquier hilo; nunca toca Tk directamente.
+        
+        Args:
+            callback (function): Función a ejecutar
+            *args: Argumentos del callback
+            widget: Si se indica, el callback se descarta cuando el widget
+                    ya fue destruido
+        """
+        self._queue.put((callback, args, widget))
+    
+    def run(self, work, callback=None, widget=None):
+        """
+        Ejecuta una tarea en un hilo de trabajo y entrega su resultado en el hilo de Tk
+        
+        Args:
+            work (function): Tarea sin argumentos (consulta, PDF, etc.)
+            callback (function): Recibe (success, result/error_message) en el hilo de Tk
+            widget: Widget dueño del callback (ver post)
+        """
+        def _work():
+            try:
+                result = (True, work())
+            except Exception as e:
+                result = (False, str(e))
+            if callback:
+                self.post(callback, result, widget=widget)
+        
+        return self._get_executor().submit(_work)
+    
+    def _get_executor(self):
+        """Crea el grupo de hilos de trabajo la primera vez que se usa"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="segundo_plano"
+                )
+            return self._executor
+    
+    def _pump(self):
+        """Ejecuta los callbacks pendientes por lote (hilo de Tk)"""
+        self._after_id = None
+        
+        # Todo el lote corre dentro de un mismo ciclo de eventos, así Tk
+        # redibuja una sola vez al volver al mainloop
+        for _ in range(self.max_batch):
+            try:
+                callback, args, widget = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                if widget is not None and not widget.winfo_exists():
+                    continue
+                callback(*args)
+            except Exception as e:
+                print(f"⚠️ Error en callback de segundo plano: {e}")
+        
+        if self._root is not None:
+            # Si quedó trabajo pendiente se continúa casi de inmediato
+            delay = self.interval_ms if self._queue.empty() else 1
+            try:
+                self._after_id = self._root.after(delay, self._pump)
+            except Exception:
+                self._after_id = None
+
+# Instancia global
+dispatcher = UIDispatcher()
@@ -24,7 +24,7 @@ class Validator:
             if max_value is not None and num > max_value:
                 return False, f"{field_name} debe ser menor o igual a {max_value}"
             return True, ""
-        except ValueError:
+        except (TypeError, ValueError):
             return False, f"{field_name} debe ser un número válido"
     
     @staticmethod
@@ -36,7 +36,7 @@ class Validator:
             if year < 1900 or year > current_year + 1:
                 return False, f"El año debe estar entre 1900 y {current_year + 1}"
             return True, ""
-        except ValueError:
+        except (TypeError, ValueError):
             return False, "El año debe ser un número válido"
     
     @staticmethod
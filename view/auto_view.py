@@ -7,8 +7,14 @@ from tkinter import filedialog, messagebox
 from controller.auto_controller import AutoController
 from utils.paths import path_manager
 from utils.printer import pdf_generator
+from utils.ui_dispatcher import dispatcher
 from utils.image_loader import ImageLoader
-from PIL import Image, ImageTk
+from utils.image_prefetcher import ImagePrefetcher
+from utils.photo_cache import photo_cache
+from utils.debounced_search import DebouncedSearch
+from utils.paged_loader import PagedLoader
+from view.virtual_table import DataTable
+from PIL import ImageTk
 from pathlib import Path
 import os
 
@@ -20,7 +26,20 @@ class AutoView(ctk.CTkFrame):
         
         self.selected_auto = None
         self.selected_image_path = None
-        self.selected_row_frame = None  # Para resaltar la fila seleccionada
+        self.image_cells = []  # Celdas de imagen del grupo de filas
+        
+        # Precarga de miniaturas según lo que muestra la tabla
+        self.prefetcher = ImagePrefetcher(
+            self,
+            lambda auto: auto.get('imagen'),
+            ImageLoader.THUMBNAIL_SIZE
+        )
+        
+        # Búsqueda con retardo en segundo plano
+        self.search = DebouncedSearch(self, self._run_search, self.show_search_results)
+        
+        # Listado completo por páginas a medida que se desplaza la tabla
+        self.loader = PagedLoader(self, AutoController.obtener_pagina, self.show_page)
         
         # Configurar grid
         self.grid_columnconfigure(0, weight=1)
@@ -34,6 +53,14 @@ class AutoView(ctk.CTkFrame):
         # Cargar datos
         self.load_autos()
     
+    def destroy(self):
+        """Cancela las descargas pendientes y libera las miniaturas antes de destruir la vista"""
+        self.prefetcher.cancel()
+        for widgets in self.image_cells:
+            self.cancel_image_job(widgets)
+            self.release_row_image(widgets)
+        super().destroy()
+    
     def create_header(self):
         """Crea el encabezado de la vista"""
         header_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
@@ -93,41 +120,33 @@ class AutoView(ctk.CTkFrame):
     
     def create_table(self):
         """Crea la tabla de autos"""
-        table_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
-        table_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
-        table_frame.grid_columnconfigure(0, weight=1)
-        table_frame.grid_rowconfigure(1, weight=1)
-        
-        headers_frame = ctk.CTkFrame(table_frame, fg_color="#F9FAFB", corner_radius=0, height=45)
-        headers_frame.grid(row=0, column=0, sticky="ew")
-        headers_frame.grid_propagate(False)
-        
-        headers = ["Imagen", "ID", "Marca", "Modelo", "Año", "Color", "Transmisión", "Precio", "Acciones"]
-        weights = [2, 1, 2, 2, 1, 2, 2, 2, 1]
-        
-        # Configurar columnas del header
-        for i, weight in enumerate(weights):
-            headers_frame.grid_columnconfigure(i, weight=weight)
-        
-        # Crear encabezados con celdas para alineación perfecta
-        for i, header in enumerate(headers):
-            header_cell = ctk.CTkFrame(headers_frame, fg_color="transparent", height=45)
-            header_cell.grid(row=0, column=i, sticky="nsew", padx=5)
-            header_cell.grid_propagate(False)
-            
-            label = ctk.CTkLabel(
-                header_cell,
-                text=header,
-                font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-                text_color="#1F2937",
-                anchor="center"
-            )
-            label.place(relx=0.5, rely=0.5, anchor="center")
+        columns = [
+            {'header': "Imagen", 'weight': 2, 'create': self.create_image_cell, 'update': self.update_image_cell},
+            {'header': "ID", 'weight': 1, 'value': lambda auto: auto['id_auto']},
+            {'header': "Marca", 'weight': 2, 'value': lambda auto: auto['marca']},
+            {'header': "Modelo", 'weight': 2, 'value': lambda auto: auto['modelo']},
+            {'header': "Año", 'weight': 1, 'value': lambda auto: auto['anio']},
+            {'header': "Color", 'weight': 2, 'value': lambda auto: auto['color']},
+            {'header': "Transmisión", 'weight': 2, 'value': lambda auto: auto['transmision']},
+            {'header': "Precio", 'weight': 2, 'value': lambda auto: f"${auto['precio']:,.2f}"},
+            {'header': "Acciones", 'weight': 1, 'actions': [
+                DataTable.edit_action(lambda auto: self.show_form(mode="editar", auto=auto)),
+                DataTable.delete_action(self.eliminar_auto)
+            ]}
+        ]
         
-        # Contenedor con scroll
-        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color="#FFFFFF")
-        self.table_scroll.grid(row=1, column=0, sticky="nsew")
-        self.table_scroll.grid_columnconfigure(0, weight=1)
+        # Tabla virtualizada: solo se crean las filas visibles y se reutilizan al desplazarse
+        self.table = DataTable(
+            self,
+            columns,
+            row_height=70,
+            key=lambda auto: auto['id_auto'],
+            on_select=self.select_auto,
+            sort_key=lambda auto: (auto['fecha_registro'], auto['id_auto']),
+            reverse=True,
+            on_viewport=self.on_table_viewport
+        )
+        self.table.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
     
     def create_buttons(self):
         """Crea los botones de acción"""
@@ -135,274 +154,181 @@ class AutoView(ctk.CTkFrame):
         pass
     
     def load_autos(self):
-        """Carga los autos en la tabla"""
-        # Limpiar tabla
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
-        
-        # Obtener autos
-        success, result = AutoController.obtener_todos()
+        """Carga los autos en la tabla (la primera página; el resto al desplazarse)"""
+        # Una búsqueda pendiente no debe sobrescribir la recarga
+        self.search.cancel()
+        self.loader.reset()
+    
+    def show_page(self, resultado, first):
+        """Muestra una página del listado de autos"""
+        success, result = resultado
         
         if not success:
             messagebox.showerror("Error", result)
             return
         
-        # Mostrar autos
-        for i, auto in enumerate(result):
-            row_frame = ctk.CTkFrame(
-                self.table_scroll,
-                fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
-                corner_radius=0,
-                height=70
-            )
-            row_frame.grid(row=i, column=0, sticky="ew", pady=1)
-            row_frame.grid_propagate(False)
-            row_frame.grid_columnconfigure(0, weight=1)
-            
-            # Configurar cursor para toda la fila
-            row_frame.configure(cursor="hand2")
-            
-            # Aplicar eventos de clic a toda la fila y sus hijos
-            self.bind_click_recursive(row_frame, auto, row_frame)
-            
-            # Eventos hover
-            row_frame.bind("<Enter>", lambda e, rf=row_frame: rf.configure(fg_color="#DBEAFE") if rf != self.selected_row_frame else None)
-            row_frame.bind("<Leave>", lambda e, rf=row_frame, idx=i: rf.configure(
-                fg_color="#BFDBFE" if rf == self.selected_row_frame else ("#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            ))
-            
-            # Contenedor principal de la fila
-            data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            data_frame.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            weights = [2, 1, 2, 2, 1, 2, 2, 2, 1]
-            
-            # Configurar columnas del data_frame
-            for col, weight in enumerate(weights):
-                data_frame.grid_columnconfigure(col, weight=weight)
-            
-            # Celda para imagen
-            img_cell = ctk.CTkFrame(data_frame, fg_color="transparent", height=60)
-            img_cell.grid(row=0, column=0, sticky="nsew", padx=5)
-            img_cell.grid_propagate(False)
-            
-            # Imagen del auto centrada
-            img_frame = ctk.CTkFrame(img_cell, fg_color="#F3F4F6", width=60, height=60, corner_radius=8)
-            img_frame.place(relx=0.5, rely=0.5, anchor="center")
-            img_frame.pack_propagate(False)
-            
-            # Mostrar placeholder mientras carga
-            placeholder = ctk.CTkLabel(img_frame, text="🚗", font=ctk.CTkFont(size=20))
-            placeholder.pack(expand=True)
-            
-            # Cargar imagen de forma asíncrona si existe
-            if auto.get('imagen'):
-                # Primero intentar obtener del caché (rápido, no bloquea)
-                imagen_cargada = ImageLoader.load_from_url(auto['imagen'], size=(50, 50), use_cache=True)
-                
-                if imagen_cargada:
-                    # Si está en caché, mostrarla inmediatamente
-                    try:
-                        placeholder.destroy()
-                        photo = ImageTk.PhotoImage(imagen_cargada)
-                        img_label = ctk.CTkLabel(img_frame, image=photo, text="")
-                        img_label.image = photo
-                        img_label.pack(expand=True)
-                    except Exception:
-                        pass
-                else:
-                    # Si no está en caché, cargar en segundo plano
-                    def update_image(img):
-                        if img and img_frame.winfo_exists():
-                            try:
-                                placeholder.destroy()
-                                photo = ImageTk.PhotoImage(img)
-                                img_label = ctk.CTkLabel(img_frame, image=photo, text="")
-                                img_label.image = photo
-                                img_label.pack(expand=True)
-                            except Exception:
-                                pass
-                    
-                    ImageLoader.load_from_url_async(auto['imagen'], (50, 50), update_image)
-            
-            # Resto de datos
-            values = [
-                auto['id_auto'],
-                auto['marca'],
-                auto['modelo'],
-                auto['anio'],
-                auto['color'],
-                auto['transmision'],
-                f"${auto['precio']:,.2f}"
-            ]
-            
-            # Crear celdas centradas para los datos
-            for j, value in enumerate(values):
-                cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=60)
-                cell_frame.grid(row=0, column=j+1, sticky="nsew", padx=5)
-                cell_frame.grid_propagate(False)
-                
-                label = ctk.CTkLabel(
-                    cell_frame,
-                    text=str(value),
-                    font=ctk.CTkFont(family="Inter", size=12),
-                    text_color="#374151",
-                    anchor="center"
-                )
-                label.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Frame para botones de acción con diseño profesional
-            actions_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=60)
-            actions_frame.grid(row=0, column=len(values)+1, sticky="nsew", padx=5)
-            actions_frame.grid_propagate(False)
-            
-            buttons_container = ctk.CTkFrame(actions_frame, fg_color="transparent")
-            buttons_container.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Botón Editar con diseño moderno
-            btn_editar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#6366F1",
-                hover_color="#4F46E5",
-                corner_radius=10,
-                border_width=0,
-                command=lambda a=auto: self.show_form(mode="editar", auto=a)
-            )
-            btn_editar.pack(side="left", padx=4)
-            
-            # Ícono de editar (lápiz) con mejor diseño
-            icon_edit_label = ctk.CTkLabel(
-                btn_editar,
-                text="✎",
-                font=ctk.CTkFont(family="Segoe UI Symbol", size=18, weight="bold"),
-                text_color="#FFFFFF"
-            )
-            icon_edit_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_edit_label.configure(cursor="hand2")
-            icon_edit_label.bind("<Button-1>", lambda e, a=auto: self.show_form(mode="editar", auto=a))
-            
-            # Botón Eliminar con diseño moderno
-            btn_eliminar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#EF4444",
-                hover_color="#DC2626",
-                corner_radius=10,
-                border_width=0,
-                command=lambda a=auto: self.eliminar_auto(a)
-            )
-            btn_eliminar.pack(side="left", padx=4)
-            
-            # Ícono de eliminar (papelera) con mejor diseño
-            icon_delete_label = ctk.CTkLabel(
-                btn_eliminar,
-                text="🗑",
-                font=ctk.CTkFont(family="Segoe UI Emoji", size=18),
-                text_color="#FFFFFF"
-            )
-            icon_delete_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_delete_label.configure(cursor="hand2")
-            icon_delete_label.bind("<Button-1>", lambda e, a=auto: self.eliminar_auto(a))
+        if first:
+            self.render_autos(result, complete=self.loader.complete)
+        else:
+            self.table.append_items(result, complete=self.loader.complete)
     
-    def bind_click_recursive(self, widget, auto, row_frame):
-        """Vincula eventos de clic a un widget y todos sus hijos recursivamente"""
-        # Excluir botones de acción del binding recursivo
-        widget_class = widget.winfo_class()
-        if 'Button' in widget_class:
+    def render_autos(self, autos, complete=True, ordered=True):
+        """Muestra una lista de autos en la tabla"""
+        self.table.set_items(autos, complete=complete, ordered=ordered)
+        
+        # Conservar la selección si el auto sigue en la lista
+        self.selected_auto = self.table.selected_item
+    
+    def refresh_auto(self, id_auto):
+        """Vuelve a leer un auto por ID y actualiza solo su fila"""
+        success, auto = AutoController.obtener_por_id(id_auto)
+        
+        if not success:
+            messagebox.showerror("Error", auto)
             return
         
-        # Vincular el evento de clic
-        widget.bind("<Button-1>", lambda e: self.select_auto(auto, row_frame))
+        if auto:
+            self.table.upsert_item(auto)
+        else:
+            self.table.remove_item(id_auto)
         
-        # Aplicar recursivamente a todos los hijos
-        for child in widget.winfo_children():
-            self.bind_click_recursive(child, auto, row_frame)
+        self.selected_auto = self.table.selected_item
     
-    def select_auto(self, auto, row_frame=None):
-        """Selecciona un auto de la tabla con resaltado visual"""
-        # Restaurar color de la fila previamente seleccionada
-        if self.selected_row_frame:
-            # Obtener el índice de la fila para saber qué color usar
-            try:
-                idx = list(self.table_scroll.winfo_children()).index(self.selected_row_frame)
-                self.selected_row_frame.configure(fg_color="#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            except:
-                pass
-        
-        # Seleccionar el nuevo auto
-        self.selected_auto = auto
-        self.selected_row_frame = row_frame
+    def create_image_cell(self, cell_frame):
+        """Crea la celda de imagen de una fila (se reutiliza al desplazarse)"""
+        # Imagen del auto centrada
+        img_frame = ctk.CTkFrame(cell_frame, fg_color="#F3F4F6", width=60, height=60, corner_radius=8)
+        img_frame.place(relx=0.5, rely=0.5, anchor="center")
+        img_frame.pack_propagate(False)
+        
+        # Placeholder mientras carga (se alterna con la imagen)
+        placeholder = ctk.CTkLabel(img_frame, text="🚗", font=ctk.CTkFont(size=20))
+        placeholder.pack(expand=True)
+        
+        widgets = {
+            'index': None,
+            'imagen_url': None,
+            'photo': None,
+            'job': None,
+            'placeholder': placeholder,
+            'imagen': ctk.CTkLabel(img_frame, text="")
+        }
+        self.image_cells.append(widgets)
+        return widgets
+    
+    def update_image_cell(self, widgets, auto, index):
+        """Muestra la miniatura del auto en una celda existente"""
+        widgets['index'] = index
+        url = auto.get('imagen')
+        if url == widgets['imagen_url'] and (widgets['photo'] is not None or widgets['job'] is not None):
+            return
         
-        # Resaltar la nueva fila seleccionada
-        if row_frame:
-            row_frame.configure(fg_color="#BFDBFE")  # Azul claro persistente
+        # La fila se reutiliza: la descarga y la miniatura del auto anterior ya no hacen falta
+        self.cancel_image_job(widgets)
+        self.release_row_image(widgets)
         
-        print(f"✓ Auto seleccionado: {auto['marca']} {auto['modelo']} (ID: {auto['id_auto']})")
-    
-    def search_autos(self, event=None):
-        """Busca autos por criterio"""
-        criterio = self.search_entry.get().strip()
+        # Mostrar el placeholder hasta tener la imagen nueva
+        widgets['imagen_url'] = url
+        widgets['imagen'].pack_forget()
+        widgets['placeholder'].pack(expand=True)
         
-        if not criterio:
-            self.load_autos()
+        if not url:
             return
         
-        # Limpiar tabla
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
+        # Una PhotoImage ya convertida se reutiliza sin tocar los píxeles
+        photo = photo_cache.acquire(url, ImageLoader.THUMBNAIL_SIZE)
+        if photo is not None:
+            self.display_row_photo(widgets, photo)
+            return
+        
+        # Primero intentar obtener del caché (solo memoria y disco, nunca la red)
+        imagen_cargada = ImageLoader.peek(url, ImageLoader.THUMBNAIL_SIZE)
+        
+        if imagen_cargada:
+            self.show_row_image(widgets, url, imagen_cargada)
+        else:
+            # Si no está en caché, cargar en segundo plano (primero las filas visibles)
+            widgets['job'] = ImageLoader.load_from_url_async(
+                url, ImageLoader.THUMBNAIL_SIZE,
+                lambda img: self.show_row_image(widgets, url, img),
+                priority=self.prefetcher.priority_for(index)
+            )
+    
+    def on_table_viewport(self, first, last):
+        """Reordena las descargas de miniaturas al cambiar el área visible de la tabla"""
+        self.prefetcher.update_viewport(self.table.get_items(), first, last)
+        self.loader.on_viewport(first, last)
+        
+        # Las filas que salieron de la vista ceden su lugar en la cola
+        for widgets in self.image_cells:
+            if widgets['job'] is not None and widgets['index'] is not None:
+                widgets['job'].set_priority(self.prefetcher.priority_for(widgets['index']))
+    
+    def cancel_image_job(self, widgets):
+        """Cancela la descarga pendiente de una celda de imagen"""
+        if widgets['job'] is not None:
+            widgets['job'].cancel()
+            widgets['job'] = None
+    
+    def release_row_image(self, widgets):
+        """Libera la miniatura que muestra una celda de imagen"""
+        if widgets['photo'] is not None:
+            photo_cache.release(widgets['imagen_url'], ImageLoader.THUMBNAIL_SIZE, widgets['photo'])
+            widgets['photo'] = None
+    
+    def show_row_image(self, widgets, url, img):
+        """Muestra la miniatura si la fila sigue mostrando el mismo auto"""
+        if widgets['imagen_url'] != url:
+            return
+        widgets['job'] = None
+        if not img or widgets['photo'] is not None or not widgets['imagen'].winfo_exists():
+            return
         
-        # Buscar autos
-        success, result = AutoController.buscar_autos(criterio)
+        try:
+            photo = photo_cache.acquire(url, ImageLoader.THUMBNAIL_SIZE, img)
+            self.display_row_photo(widgets, photo)
+        except Exception:
+            pass
+    
+    def display_row_photo(self, widgets, photo):
+        """Muestra una PhotoImage (ya adquirida del caché) en la celda"""
+        widgets['photo'] = photo
+        widgets['imagen'].configure(image=photo)
+        widgets['placeholder'].pack_forget()
+        widgets['imagen'].pack(expand=True)
+    
+    def select_auto(self, auto):
+        """Selecciona un auto de la tabla (la tabla resalta la fila)"""
+        self.selected_auto = auto
+        
+        print(f"✓ Auto seleccionado: {auto['marca']} {auto['modelo']} (ID: {auto['id_auto']})")
+    
+    def search_autos(self, event=None):
+        """Busca autos por criterio (con retardo y en segundo plano)"""
+        self.search.schedule(self.search_entry.get().strip())
+    
+    def _run_search(self, criterio):
+        """Consulta de búsqueda (se ejecuta en un hilo de trabajo)"""
+        if not criterio:
+            # Sin criterio se vuelve al listado por páginas
+            return True, None
+        return AutoController.buscar_autos(criterio)
+    
+    def show_search_results(self, resultado):
+        """Muestra el resultado de la búsqueda más reciente"""
+        success, result = resultado
         
         if not success:
             messagebox.showerror("Error", result)
             return
         
-        # Mostrar resultados
-        for i, auto in enumerate(result):
-            row_frame = ctk.CTkFrame(
-                self.table_scroll,
-                fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
-                corner_radius=0
-            )
-            row_frame.grid(row=i, column=0, sticky="ew", pady=1)
-            row_frame.grid_columnconfigure(0, weight=1)
-            
-            row_frame.bind("<Button-1>", lambda e, a=auto: self.select_auto(a))
-            row_frame.bind("<Enter>", lambda e, rf=row_frame: rf.configure(fg_color="#DBEAFE"))
-            row_frame.bind("<Leave>", lambda e, rf=row_frame, idx=i: rf.configure(
-                fg_color="#FFFFFF" if idx % 2 == 0 else "#F9FAFB"
-            ))
-            
-            data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            data_frame.pack(fill="x", padx=5, pady=8)
-            
-            weights = [1, 2, 2, 1, 2, 2, 2, 2]
-            values = [
-                auto['id_auto'],
-                auto['modelo'],
-                auto['anio'],
-                auto['color'],
-                auto['transmision'],
-                auto['combustible'],
-                f"${auto['precio']:,.2f}"
-            ]
-            
-            for j, (value, weight) in enumerate(zip(values, weights)):
-                data_frame.grid_columnconfigure(j, weight=weight)
-                label = ctk.CTkLabel(
-                    data_frame,
-                    text=str(value),
-                    font=ctk.CTkFont(family="Inter", size=12),
-                    text_color="#1F2937"
-                )
-                label.grid(row=0, column=j, padx=10, sticky="w")
-                label.bind("<Button-1>", lambda e, a=auto: self.select_auto(a))
+        if result is None:
+            self.load_autos()
+            return
+        
+        # Los resultados vienen por relevancia, no en el orden de la tabla
+        self.loader.stop()
+        self.render_autos(result, ordered=False)
     
     def show_form_nuevo(self):
         """Muestra el formulario para crear un nuevo auto"""
@@ -660,23 +586,43 @@ class AutoView(ctk.CTkFrame):
             self.update_image_preview(filename)
     
     def update_image_preview(self, image_path):
-        """Actualiza la vista previa de la imagen"""
-        try:
-            # Limpiar preview anterior
-            for widget in self.preview_frame.winfo_children():
-                widget.destroy()
-                
-            # Cargar y mostrar nueva imagen
-            img = Image.open(image_path)
-            img = img.resize((180, 180), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            
-            preview = ctk.CTkLabel(self.preview_frame, image=photo, text="")
-            preview.image = photo
-            preview.place(relx=0.5, rely=0.5, anchor="center")
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo cargar la imagen: {str(e)}")
+        """Actualiza la vista previa de la imagen (la decodificación es en segundo plano)"""
+        # Limpiar preview anterior
+        for widget in self.preview_frame.winfo_children():
+            widget.destroy()
+        
+        loading = ctk.CTkLabel(
+            self.preview_frame,
+            text="Cargando...",
+            font=ctk.CTkFont(family="Inter", size=12),
+            text_color="#9CA3AF"
+        )
+        loading.place(relx=0.5, rely=0.5, anchor="center")
+        
+        ImageLoader.load_from_path_async(
+            image_path, (180, 180),
+            lambda img: self.show_image_preview(image_path, img),
+            widget=self.preview_frame
+        )
+    
+    def show_image_preview(self, image_path, img):
+        """Muestra la vista previa si la imagen sigue siendo la seleccionada"""
+        if image_path != self.selected_image_path:
+            return
+        
+        for widget in self.preview_frame.winfo_children():
+            widget.destroy()
+        
+        if img is None:
+            messagebox.showerror("Error", "No se pudo cargar la imagen")
             self.selected_image_path = None
+            return
+        
+        photo = ImageTk.PhotoImage(img)
+        
+        preview = ctk.CTkLabel(self.preview_frame, image=photo, text="")
+        preview.image = photo
+        preview.place(relx=0.5, rely=0.5, anchor="center")
     
     def save_auto(self, mode, entries, transmision_var, combustible_var, window, auto=None):
         """Guarda el auto (crear o actualizar)"""
@@ -701,8 +647,8 @@ class AutoView(ctk.CTkFrame):
         if success:
             # Destruir ventana primero para evitar que se sobreponga
             window.destroy()
-            # Recargar datos
-            self.load_autos()
+            # Actualizar solo la fila del auto guardado
+            self.refresh_auto(result if mode == "nuevo" else auto['id_auto'])
             # Mostrar mensaje después
             messagebox.showinfo("Éxito", "Auto guardado correctamente")
         else:
@@ -729,21 +675,37 @@ class AutoView(ctk.CTkFrame):
         
         if success:
             messagebox.showinfo("Éxito", "Auto eliminado correctamente")
-            self.selected_auto = None
-            self.load_autos()
+            ImageLoader.invalidate(auto.get('imagen'))
+            self.table.remove_item(auto['id_auto'])
+            self.selected_auto = self.table.selected_item
         else:
             messagebox.showerror("Error", result)
     
     def generar_pdf(self):
-        """Genera un PDF del auto seleccionado e invoca el diálogo de impresión"""
+        """Genera un PDF del auto seleccionado en segundo plano"""
         if not self.selected_auto:
             messagebox.showwarning("Advertencia", "Debe seleccionar un auto para generar el PDF")
             return
         
+        auto = self.selected_auto
+        filename = f"auto_{auto['id_auto']}_{auto['marca']}_{auto['modelo']}.pdf"
+        
+        # El PDF se arma en un hilo de trabajo y el resultado vuelve al hilo de Tk
+        dispatcher.run(
+            lambda: pdf_generator.generate_auto_report(auto, filename),
+            self.show_pdf_result,
+            widget=self
+        )
+    
+    def show_pdf_result(self, resultado):
+        """Ofrece imprimir o abrir el PDF generado (hilo de Tk)"""
+        success, output_path = resultado
+        
+        if not success:
+            messagebox.showerror("Error", f"Error al generar PDF: {output_path}")
+            return
+        
         try:
-            filename = f"auto_{self.selected_auto['id_auto']}_{self.selected_auto['marca']}_{self.selected_auto['modelo']}.pdf"
-            output_path = pdf_generator.generate_auto_report(self.selected_auto, filename)
-            
             # Preguntar qué acción desea realizar
             respuesta = messagebox.askyesnocancel(
                 "PDF Generado",
@@ -762,4 +724,4 @@ class AutoView(ctk.CTkFrame):
             # Si es None (Cancelar), no hacer nada
             
         except Exception as e:
-            messagebox.showerror("Error", f"Error al generar PDF: {str(e)}")
+            messagebox.showerror("Error", f"Error al abrir el PDF: {str(e)}")
@@ -6,6 +6,10 @@ import customtkinter as ctk
 from tkinter import messagebox
 from controller.cliente_controller import ClienteController
 from utils.printer import pdf_generator
+from utils.ui_dispatcher import dispatcher
+from utils.debounced_search import DebouncedSearch
+from utils.paged_loader import PagedLoader
+from view.virtual_table import DataTable, collation_key
 
 class ClienteView(ctk.CTkFrame):
     """Vista de gestión de clientes"""
@@ -14,7 +18,12 @@ class ClienteView(ctk.CTkFrame):
         super().__init__(parent, fg_color="#F4F6F7")
         
         self.selected_cliente = None
-        self.selected_row_frame = None  # Para resaltar la fila seleccionada
+        
+        # Búsqueda con retardo en segundo plano
+        self.search = DebouncedSearch(self, self._run_search, self.show_search_results)
+        
+        # Listado completo por páginas a medida que se desplaza la tabla
+        self.loader = PagedLoader(self, ClienteController.obtener_pagina, self.show_page)
         
         # Configurar grid
         self.grid_columnconfigure(0, weight=1)
@@ -84,40 +93,28 @@ class ClienteView(ctk.CTkFrame):
     
     def create_table(self):
         """Crea la tabla de clientes"""
-        table_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
-        table_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
-        table_frame.grid_columnconfigure(0, weight=1)
-        table_frame.grid_rowconfigure(1, weight=1)
-        
-        headers_frame = ctk.CTkFrame(table_frame, fg_color="#F9FAFB", corner_radius=0, height=45)
-        headers_frame.grid(row=0, column=0, sticky="ew")
-        headers_frame.grid_propagate(False)
-        
-        headers = ["ID", "Nombre", "Teléfono", "Correo", "Dirección", "Acciones"]
-        weights = [1, 3, 2, 3, 3, 1]
-        
-        # Configurar columnas del header
-        for i, weight in enumerate(weights):
-            headers_frame.grid_columnconfigure(i, weight=weight)
-        
-        # Crear encabezados con celdas para alineación perfecta
-        for i, header in enumerate(headers):
-            header_cell = ctk.CTkFrame(headers_frame, fg_color="transparent", height=45)
-            header_cell.grid(row=0, column=i, sticky="nsew", padx=5)
-            header_cell.grid_propagate(False)
-            
-            label = ctk.CTkLabel(
-                header_cell,
-                text=header,
-                font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-                text_color="#1F2937",
-                anchor="center"
-            )
-            label.place(relx=0.5, rely=0.5, anchor="center")
+        columns = [
+            {'header': "ID", 'weight': 1, 'value': lambda cliente: cliente['id_cliente']},
+            {'header': "Nombre", 'weight': 3, 'value': lambda cliente: cliente['nombre']},
+            {'header': "Teléfono", 'weight': 2, 'value': lambda cliente: cliente['telefono'] or "N/A"},
+            {'header': "Correo", 'weight': 3, 'value': lambda cliente: cliente['correo'] or "N/A"},
+            {'header': "Dirección", 'weight': 3, 'value': lambda cliente: cliente['direccion'] or "N/A"},
+            {'header': "Acciones", 'weight': 1, 'actions': [
+                DataTable.edit_action(lambda cliente: self.show_form(mode="editar", cliente=cliente)),
+                DataTable.delete_action(self.eliminar_cliente)
+            ]}
+        ]
         
-        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color="#FFFFFF")
-        self.table_scroll.grid(row=1, column=0, sticky="nsew")
-        self.table_scroll.grid_columnconfigure(0, weight=1)
+        self.table = DataTable(
+            self,
+            columns,
+            row_height=50,
+            key=lambda cliente: cliente['id_cliente'],
+            on_select=self.select_cliente,
+            sort_key=lambda cliente: (collation_key(cliente['nombre']), cliente['id_cliente']),
+            on_viewport=self.loader.on_viewport
+        )
+        self.table.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
     
     def create_buttons(self):
         """Crea los botones de acción"""
@@ -125,281 +122,78 @@ class ClienteView(ctk.CTkFrame):
         pass
     
     def load_clientes(self):
-        """Carga los clientes en la tabla"""
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
-        
-        success, result = ClienteController.obtener_todos()
+        """Carga los clientes en la tabla (la primera página; el resto al desplazarse)"""
+        # Una búsqueda pendiente no debe sobrescribir la recarga
+        self.search.cancel()
+        self.loader.reset()
+    
+    def show_page(self, resultado, first):
+        """Muestra una página del listado de clientes"""
+        success, result = resultado
         
         if not success:
             messagebox.showerror("Error", result)
             return
         
-        for i, cliente in enumerate(result):
-            row_frame = ctk.CTkFrame(
-                self.table_scroll,
-                fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
-                corner_radius=0,
-                height=50
-            )
-            row_frame.grid(row=i, column=0, sticky="ew", pady=1)
-            row_frame.grid_propagate(False)
-            row_frame.grid_columnconfigure(0, weight=1)
-            
-            # Configurar cursor para toda la fila
-            row_frame.configure(cursor="hand2")
-            
-            # Aplicar eventos de clic a toda la fila y sus hijos
-            self.bind_click_recursive(row_frame, cliente, row_frame)
-            
-            # Eventos hover
-            row_frame.bind("<Enter>", lambda e, rf=row_frame: rf.configure(fg_color="#DBEAFE") if rf != self.selected_row_frame else None)
-            row_frame.bind("<Leave>", lambda e, rf=row_frame, idx=i: rf.configure(
-                fg_color="#BFDBFE" if rf == self.selected_row_frame else ("#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            ))
-            
-            data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            data_frame.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            weights = [1, 3, 2, 3, 3, 1]
-            values = [
-                cliente['id_cliente'],
-                cliente['nombre'],
-                cliente['telefono'] or "N/A",
-                cliente['correo'] or "N/A",
-                cliente['direccion'] or "N/A"
-            ]
-            
-            # Configurar columnas
-            for col, weight in enumerate(weights):
-                data_frame.grid_columnconfigure(col, weight=weight)
-            
-            # Crear celdas centradas para los datos
-            for j, value in enumerate(values):
-                cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=40)
-                cell_frame.grid(row=0, column=j, sticky="nsew", padx=5)
-                cell_frame.grid_propagate(False)
-                
-                label = ctk.CTkLabel(
-                    cell_frame,
-                    text=str(value),
-                    font=ctk.CTkFont(family="Inter", size=12),
-                    text_color="#374151",
-                    anchor="center"
-                )
-                label.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Frame para botones de acción con diseño profesional
-            actions_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=40)
-            actions_frame.grid(row=0, column=len(values), sticky="nsew", padx=5)
-            actions_frame.grid_propagate(False)
-            
-            buttons_container = ctk.CTkFrame(actions_frame, fg_color="transparent")
-            buttons_container.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Botón Editar con diseño moderno
-            btn_editar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#6366F1",
-                hover_color="#4F46E5",
-                corner_radius=10,
-                border_width=0,
-                command=lambda c=cliente: self.show_form(mode="editar", cliente=c)
-            )
-            btn_editar.pack(side="left", padx=4)
-            
-            # Ícono de editar (lápiz) con mejor diseño
-            icon_edit_label = ctk.CTkLabel(
-                btn_editar,
-                text="✎",
-                font=ctk.CTkFont(family="Segoe UI Symbol", size=18, weight="bold"),
-                text_color="#FFFFFF"
-            )
-            icon_edit_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_edit_label.configure(cursor="hand2")
-            icon_edit_label.bind("<Button-1>", lambda e, c=cliente: self.show_form(mode="editar", cliente=c))
-            
-            # Botón Eliminar con diseño moderno
-            btn_eliminar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#EF4444",
-                hover_color="#DC2626",
-                corner_radius=10,
-                border_width=0,
-                command=lambda c=cliente: self.eliminar_cliente(c)
-            )
-            btn_eliminar.pack(side="left", padx=4)
-            
-            # Ícono de eliminar (papelera) con mejor diseño
-            icon_delete_label = ctk.CTkLabel(
-                btn_eliminar,
-                text="🗑",
-                font=ctk.CTkFont(family="Segoe UI Emoji", size=18),
-                text_color="#FFFFFF"
-            )
-            icon_delete_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_delete_label.configure(cursor="hand2")
-            icon_delete_label.bind("<Button-1>", lambda e, c=cliente: self.eliminar_cliente(c))
+        if first:
+            self.render_clientes(result, complete=self.loader.complete)
+        else:
+            self.table.append_items(result, complete=self.loader.complete)
     
-    def bind_click_recursive(self, widget, cliente, row_frame):
-        """Vincula eventos de clic a un widget y todos sus hijos recursivamente"""
-        # Excluir botones de acción del binding recursivo
-        widget_class = widget.winfo_class()
-        if 'Button' in widget_class:
+    def render_clientes(self, clientes, complete=True, ordered=True):
+        """Muestra una lista de clientes en la tabla"""
+        self.table.set_items(clientes, complete=complete, ordered=ordered)
+        
+        # Conservar la selección si el cliente sigue en la lista
+        self.selected_cliente = self.table.selected_item
+    
+    def refresh_cliente(self, id_cliente):
+        """Vuelve a leer un cliente por ID y actualiza solo su fila"""
+        success, cliente = ClienteController.obtener_por_id(id_cliente)
+        
+        if not success:
+            messagebox.showerror("Error", cliente)
             return
         
-        # Vincular el evento de clic
-        widget.bind("<Button-1>", lambda e: self.select_cliente(cliente, row_frame))
+        if cliente:
+            self.table.upsert_item(cliente)
+        else:
+            self.table.remove_item(id_cliente)
         
-        # Aplicar recursivamente a todos los hijos
-        for child in widget.winfo_children():
-            self.bind_click_recursive(child, cliente, row_frame)
+        self.selected_cliente = self.table.selected_item
     
-    def select_cliente(self, cliente, row_frame=None):
-        """Selecciona un cliente de la tabla con resaltado visual"""
-        # Restaurar color de la fila previamente seleccionada
-        if self.selected_row_frame:
-            try:
-                idx = list(self.table_scroll.winfo_children()).index(self.selected_row_frame)
-                self.selected_row_frame.configure(fg_color="#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            except:
-                pass
-        
-        # Seleccionar el nuevo cliente
+    def select_cliente(self, cliente):
+        """Selecciona un cliente de la tabla (la tabla resalta la fila)"""
         self.selected_cliente = cliente
-        self.selected_row_frame = row_frame
-        
-        # Resaltar la nueva fila seleccionada
-        if row_frame:
-            row_frame.configure(fg_color="#BFDBFE")
         
         print(f"✓ Cliente seleccionado: {cliente['nombre']} (ID: {cliente['id_cliente']})")
     
     def search_clientes(self, event=None):
-        """Busca clientes por criterio"""
-        criterio = self.search_entry.get().strip()
-        
+        """Busca clientes por criterio (con retardo y en segundo plano)"""
+        self.search.schedule(self.search_entry.get().strip())
+    
+    def _run_search(self, criterio):
+        """Consulta de búsqueda (se ejecuta en un hilo de trabajo)"""
         if not criterio:
-            self.load_clientes()
-            return
-        
-        # Limpiar tabla
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
-        
-        # Buscar clientes
-        success, result = ClienteController.buscar_clientes(criterio)
+            # Sin criterio se vuelve al listado por páginas
+            return True, None
+        return ClienteController.buscar_clientes(criterio)
+    
+    def show_search_results(self, resultado):
+        """Muestra el resultado de la búsqueda más reciente"""
+        success, result = resultado
         
         if not success:
             messagebox.showerror("Error", result)
             return
-            
-            # Mostrar resultados
-            for i, cliente in enumerate(result):
-                row_frame = ctk.CTkFrame(
-                    self.table_scroll,
-                    fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
-                    corner_radius=0,
-                    height=50
-                )
-                row_frame.grid(row=i, column=0, sticky="ew", pady=1)
-                row_frame.grid_propagate(False)
-                row_frame.grid_columnconfigure(0, weight=1)
-                
-                data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-                data_frame.pack(fill="both", expand=True, padx=10, pady=5)
-                
-                weights = [1, 3, 2, 3, 3, 1]
-                values = [
-                    cliente['id_cliente'],
-                    cliente['nombre'],
-                    cliente['telefono'] or "N/A",
-                    cliente['correo'] or "N/A",
-                    cliente['direccion'] or "N/A"
-                ]
-                
-                # Configurar columnas
-                for col, weight in enumerate(weights[:-1]):
-                    data_frame.grid_columnconfigure(col, weight=weight, minsize=50)
-                
-                # Crear celdas
-                for j, (value, weight) in enumerate(zip(values, weights[:-1])):
-                    cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=35)
-                    cell_frame.grid(row=0, column=j, sticky="nsew", padx=5)
-                    cell_frame.grid_propagate(False)
-                    
-                    label = ctk.CTkLabel(
-                        cell_frame,
-                        text=str(value),
-                        font=ctk.CTkFont(family="Inter", size=12),
-                        text_color="#374151",
-                        anchor="center"
-                    )
-                    label.place(relx=0.5, rely=0.5, anchor="center")
-                
-                # Frame para botones de acción con diseño profesional
-                actions_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=35)
-                actions_frame.grid(row=0, column=len(values), sticky="nsew", padx=5)
-                actions_frame.grid_propagate(False)
-                
-                buttons_container = ctk.CTkFrame(actions_frame, fg_color="transparent")
-                buttons_container.place(relx=0.5, rely=0.5, anchor="center")
-                
-                # Botón Editar con diseño moderno
-                btn_editar = ctk.CTkButton(
-                    buttons_container,
-                    text="",
-                    width=40,
-                    height=40,
-                    fg_color="#6366F1",
-                    hover_color="#4F46E5",
-                    corner_radius=10,
-                    border_width=0,
-                    command=lambda c=cliente: self.show_form(mode="editar", cliente=c)
-                )
-                btn_editar.pack(side="left", padx=4)
-                
-                # Ícono de editar (lápiz) con mejor diseño
-                icon_edit_label = ctk.CTkLabel(
-                    btn_editar,
-                    text="✎",
-                    font=ctk.CTkFont(family="Segoe UI Symbol", size=18, weight="bold"),
-                    text_color="#FFFFFF"
-                )
-                icon_edit_label.place(relx=0.5, rely=0.5, anchor="center")
-                icon_edit_label.configure(cursor="hand2")
-                icon_edit_label.bind("<Button-1>", lambda e, c=cliente: self.show_form(mode="editar", cliente=c))
-                
-                # Botón Eliminar con diseño moderno
-                btn_eliminar = ctk.CTkButton(
-                    buttons_container,
-                    text="",
-                    width=40,
-                    height=40,
-                    fg_color="#EF4444",
-                    hover_color="#DC2626",
-                    corner_radius=10,
-                    border_width=0,
-                    command=lambda c=cliente: self.eliminar_cliente(c)
-                )
-                btn_eliminar.pack(side="left", padx=4)
-                
-                # Ícono de eliminar (papelera) con mejor diseño
-                icon_delete_label = ctk.CTkLabel(
-                    btn_eliminar,
-                    text="🗑",
-                    font=ctk.CTkFont(family="Segoe UI Emoji", size=18),
-                    text_color="#FFFFFF"
-                )
-                icon_delete_label.place(relx=0.5, rely=0.5, anchor="center")
-                icon_delete_label.configure(cursor="hand2")
-                icon_delete_label.bind("<Button-1>", lambda e, c=cliente: self.eliminar_cliente(c))
+        
+        if result is None:
+            self.load_clientes()
+            return
+        
+        # Los resultados vienen por relevancia, no en el orden de la tabla
+        self.loader.stop()
+        self.render_clientes(result, ordered=False)
             
     def show_form_nuevo(self):
         """Muestra el formulario para crear un nuevo cliente"""
@@ -539,8 +333,8 @@ class ClienteView(ctk.CTkFrame):
         if success:
             # Destruir ventana primero para evitar que se sobreponga
             window.destroy()
-            # Recargar datos
-            self.load_clientes()
+            # Actualizar solo la fila del cliente guardado
+            self.refresh_cliente(result if mode == "nuevo" else cliente['id_cliente'])
             # Mostrar mensaje después
             messagebox.showinfo("Éxito", "Cliente guardado correctamente")
         else:
@@ -561,25 +355,32 @@ class ClienteView(ctk.CTkFrame):
         
         if success:
             messagebox.showinfo("Éxito", "Cliente eliminado correctamente")
-            self.load_clientes()
+            self.table.remove_item(cliente['id_cliente'])
+            self.selected_cliente = self.table.selected_item
         else:
             messagebox.showerror("Error", result)
     
     def generar_pdf(self):
-        """Genera un PDF con la lista de clientes e invoca el diálogo de impresión"""
+        """Genera un PDF con la lista de clientes en segundo plano"""
+        filename = "lista_clientes.pdf"
+        
+        # Leer los clientes en bloques (sin una lista intermedia de la consulta);
+        # el PDF se arma en un hilo de trabajo y el resultado vuelve al hilo de Tk
+        dispatcher.run(
+            lambda: pdf_generator.generate_cliente_report(filename, ClienteController.iterar_todos()),
+            self.show_pdf_result,
+            widget=self
+        )
+    
+    def show_pdf_result(self, resultado):
+        """Ofrece imprimir o abrir el PDF generado (hilo de Tk)"""
+        success, output_path = resultado
+        
+        if not success:
+            messagebox.showerror("Error", f"Error al generar PDF: {output_path}")
+            return
+        
         try:
-            # Obtener todos los clientes
-            success, result = ClienteController.obtener_todos()
-            
-            if not success:
-                messagebox.showerror("Error", f"No se pudieron obtener los clientes: {result}")
-                return
-            
-            clientes = result
-            
-            filename = "lista_clientes.pdf"
-            output_path = pdf_generator.generate_cliente_report(filename, clientes)
-            
             # Preguntar qué acción desea realizar
             respuesta = messagebox.askyesnocancel(
                 "PDF Generado",
@@ -597,4 +398,4 @@ class ClienteView(ctk.CTkFrame):
                 pdf_generator.open_pdf(output_path)
             
         except Exception as e:
-            messagebox.showerror("Error", f"Error al generar PDF: {str(e)}")
+            messagebox.showerror("Error", f"Error al abrir el PDF: {str(e)}")
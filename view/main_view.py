@@ -7,6 +7,8 @@ from view.auto_view import AutoView
 from view.cliente_view import ClienteView
 from view.venta_view import VentaView
 from model.conexion import db
+from model.migraciones import Migraciones
+from utils.ui_dispatcher import dispatcher
 
 ctk.set_appearance_mode("light")
 ctk.set_default_color_theme("blue")
@@ -22,12 +24,20 @@ class MainApplication(ctk.CTk):
         self.geometry("1400x800")
         self.minsize(1200, 700)
         
+        # Los resultados de los hilos de trabajo se ejecutan en este hilo
+        dispatcher.install(self)
+        
         # Conectar a la base de datos
         success, message = db.connect()
         if not success:
             self.show_error_and_exit(message)
             return
         
+        # Aplicar migraciones pendientes del esquema (índices, etc.)
+        success, result = Migraciones.aplicar_pendientes()
+        if not success:
+            print(f"⚠️ {result}")
+        
         # Configurar grid
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -192,5 +202,6 @@ class MainApplication(ctk.CTk):
     
     def quit_app(self):
         """Cierra la aplicación y desconecta la base de datos"""
+        dispatcher.shutdown()
         db.disconnect()
         self.quit()
@@ -8,16 +8,25 @@ from controller.venta_controller import VentaController
 from controller.auto_controller import AutoController
 from controller.cliente_controller import ClienteController
 from utils.printer import pdf_generator
+from utils.ui_dispatcher import dispatcher
+from utils.paged_loader import PagedLoader
+from utils.debounced_search import DebouncedSearch
+from view.virtual_table import DataTable
 from datetime import datetime
 
 class VentaView(ctk.CTkFrame):
     """Vista de gestión de ventas"""
     
+    # Opciones de cliente y auto que muestra cada combo del formulario
+    OPCIONES_COMBO = 50
+    
     def __init__(self, parent):
         super().__init__(parent, fg_color="#F4F6F7")
         
         self.selected_venta = None
-        self.selected_row_frame = None  # Para resaltar la fila seleccionada
+        
+        # Listado por páginas a medida que se desplaza la tabla
+        self.loader = PagedLoader(self, VentaController.obtener_pagina, self.show_page)
         
         # Configurar grid
         self.grid_columnconfigure(0, weight=1)
@@ -86,40 +95,29 @@ class VentaView(ctk.CTkFrame):
     
     def create_table(self):
         """Crea la tabla de ventas"""
-        table_frame = ctk.CTkFrame(self, fg_color="#FFFFFF", corner_radius=10)
-        table_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
-        table_frame.grid_columnconfigure(0, weight=1)
-        table_frame.grid_rowconfigure(1, weight=1)
-        
-        headers_frame = ctk.CTkFrame(table_frame, fg_color="#F9FAFB", corner_radius=0, height=45)
-        headers_frame.grid(row=0, column=0, sticky="ew")
-        headers_frame.grid_propagate(False)
-        
-        headers = ["ID", "Cliente", "Auto", "Fecha", "Monto", "Método de Pago", "Acciones"]
-        weights = [1, 3, 3, 2, 2, 2, 1]
-        
-        # Configurar columnas del header
-        for i, weight in enumerate(weights):
-            headers_frame.grid_columnconfigure(i, weight=weight)
-        
-        # Crear encabezados con celdas para alineación perfecta
-        for i, header in enumerate(headers):
-            header_cell = ctk.CTkFrame(headers_frame, fg_color="transparent", height=45)
-            header_cell.grid(row=0, column=i, sticky="nsew", padx=5)
-            header_cell.grid_propagate(False)
-            
-            label = ctk.CTkLabel(
-                header_cell,
-                text=header,
-                font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
-                text_color="#1F2937",
-                anchor="center"
-            )
-            label.place(relx=0.5, rely=0.5, anchor="center")
-        
-        self.table_scroll = ctk.CTkScrollableFrame(table_frame, fg_color="#FFFFFF")
-        self.table_scroll.grid(row=1, column=0, sticky="nsew")
-        self.table_scroll.grid_columnconfigure(0, weight=1)
+        columns = [
+            {'header': "ID", 'weight': 1, 'value': lambda venta: venta['id_venta']},
+            {'header': "Cliente", 'weight': 3, 'value': lambda venta: venta['cliente_nombre']},
+            {'header': "Auto", 'weight': 3, 'value': lambda venta: f"{venta['auto_marca']} {venta['auto_modelo']} ({venta['auto_anio']})"},
+            {'header': "Fecha", 'weight': 2, 'value': lambda venta: venta['fecha_venta']},
+            {'header': "Monto", 'weight': 2, 'value': lambda venta: f"${venta['monto']:,.2f}"},
+            {'header': "Método de Pago", 'weight': 2, 'value': lambda venta: venta['metodo_pago']},
+            {'header': "Acciones", 'weight': 1, 'actions': [
+                DataTable.delete_action(self.eliminar_venta)
+            ]}
+        ]
+        
+        self.table = DataTable(
+            self,
+            columns,
+            row_height=50,
+            key=lambda venta: venta['id_venta'],
+            on_select=self.select_venta,
+            sort_key=lambda venta: (venta['fecha_venta'], venta['id_venta']),
+            reverse=True,
+            on_viewport=self.loader.on_viewport
+        )
+        self.table.grid(row=1, column=0, sticky="nsew", pady=(0, 20))
     
     def create_buttons(self):
         """Crea los botones de acción"""
@@ -127,136 +125,43 @@ class VentaView(ctk.CTkFrame):
         pass
     
     def load_ventas(self):
-        """Carga las ventas en la tabla"""
-        for widget in self.table_scroll.winfo_children():
-            widget.destroy()
-        
-        success, result = VentaController.obtener_todas()
+        """Carga las ventas en la tabla (la primera página; el resto al desplazarse)"""
+        self.loader.reset()
+    
+    def show_page(self, resultado, first):
+        """Muestra una página del listado de ventas"""
+        success, result = resultado
         
         if not success:
             messagebox.showerror("Error", result)
             return
         
-        for i, venta in enumerate(result):
-            row_frame = ctk.CTkFrame(
-                self.table_scroll,
-                fg_color="#FFFFFF" if i % 2 == 0 else "#F9FAFB",
-                corner_radius=0,
-                height=50
-            )
-            row_frame.grid(row=i, column=0, sticky="ew", pady=1)
-            row_frame.grid_propagate(False)
-            row_frame.grid_columnconfigure(0, weight=1)
-            
-            # Configurar cursor para toda la fila
-            row_frame.configure(cursor="hand2")
-            
-            # Aplicar eventos de clic a toda la fila y sus hijos
-            self.bind_click_recursive(row_frame, venta, row_frame)
-            
-            # Eventos hover
-            row_frame.bind("<Enter>", lambda e, rf=row_frame: rf.configure(fg_color="#DBEAFE") if rf != self.selected_row_frame else None)
-            row_frame.bind("<Leave>", lambda e, rf=row_frame, idx=i: rf.configure(
-                fg_color="#BFDBFE" if rf == self.selected_row_frame else ("#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            ))
-            
-            data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
-            data_frame.pack(fill="both", expand=True, padx=10, pady=5)
-            
-            weights = [1, 3, 3, 2, 2, 2, 1]
-            auto_info = f"{venta['auto_marca']} {venta['auto_modelo']} ({venta['auto_anio']})"
-            values = [
-                venta['id_venta'],
-                venta['cliente_nombre'],
-                auto_info,
-                str(venta['fecha_venta']),
-                f"${venta['monto']:,.2f}",
-                venta['metodo_pago']
-            ]
-            
-            # Configurar columnas
-            for col, weight in enumerate(weights):
-                data_frame.grid_columnconfigure(col, weight=weight)
-            
-            # Crear celdas centradas para los datos
-            for j, value in enumerate(values):
-                cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=40)
-                cell_frame.grid(row=0, column=j, sticky="nsew", padx=5)
-                cell_frame.grid_propagate(False)
-                
-                label = ctk.CTkLabel(
-                    cell_frame,
-                    text=str(value),
-                    font=ctk.CTkFont(family="Inter", size=12),
-                    text_color="#374151",
-                    anchor="center"
-                )
-                label.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Frame para botones de acción con diseño profesional
-            actions_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=40)
-            actions_frame.grid(row=0, column=len(values), sticky="nsew", padx=5)
-            actions_frame.grid_propagate(False)
-            
-            buttons_container = ctk.CTkFrame(actions_frame, fg_color="transparent")
-            buttons_container.place(relx=0.5, rely=0.5, anchor="center")
-            
-            # Botón Eliminar con diseño moderno
-            btn_eliminar = ctk.CTkButton(
-                buttons_container,
-                text="",
-                width=40,
-                height=40,
-                fg_color="#EF4444",
-                hover_color="#DC2626",
-                corner_radius=10,
-                border_width=0,
-                command=lambda v=venta: self.eliminar_venta(v)
-            )
-            btn_eliminar.pack(side="left", padx=4)
-            
-            # Ícono de eliminar (papelera) con mejor diseño
-            icon_delete_label = ctk.CTkLabel(
-                btn_eliminar,
-                text="🗑",
-                font=ctk.CTkFont(family="Segoe UI Emoji", size=18),
-                text_color="#FFFFFF"
-            )
-            icon_delete_label.place(relx=0.5, rely=0.5, anchor="center")
-            icon_delete_label.configure(cursor="hand2")
-            icon_delete_label.bind("<Button-1>", lambda e, v=venta: self.eliminar_venta(v))
+        if first:
+            self.table.set_items(result, complete=self.loader.complete)
+        else:
+            self.table.append_items(result, complete=self.loader.complete)
+        
+        # Conservar la selección si la venta sigue en la lista
+        self.selected_venta = self.table.selected_item
     
-    def bind_click_recursive(self, widget, venta, row_frame):
-        """Vincula eventos de clic a un widget y todos sus hijos recursivamente"""
-        # Excluir botones de acción del binding recursivo
-        widget_class = widget.winfo_class()
-        if 'Button' in widget_class:
+    def refresh_venta(self, id_venta):
+        """Vuelve a leer una venta por ID y actualiza solo su fila"""
+        success, venta = VentaController.obtener_por_id(id_venta)
+        
+        if not success:
+            messagebox.showerror("Error", venta)
             return
         
-        # Vincular el evento de clic
-        widget.bind("<Button-1>", lambda e: self.select_venta(venta, row_frame))
+        if venta:
+            self.table.upsert_item(venta)
+        else:
+            self.table.remove_item(id_venta)
         
-        # Aplicar recursivamente a todos los hijos
-        for child in widget.winfo_children():
-            self.bind_click_recursive(child, venta, row_frame)
+        self.selected_venta = self.table.selected_item
     
-    def select_venta(self, venta, row_frame=None):
-        """Selecciona una venta de la tabla con resaltado visual"""
-        # Restaurar color de la fila previamente seleccionada
-        if self.selected_row_frame:
-            try:
-                idx = list(self.table_scroll.winfo_children()).index(self.selected_row_frame)
-                self.selected_row_frame.configure(fg_color="#FFFFFF" if idx % 2 == 0 else "#F9FAFB")
-            except:
-                pass
-        
-        # Seleccionar la nueva venta
+    def select_venta(self, venta):
+        """Selecciona una venta de la tabla (la tabla resalta la fila)"""
         self.selected_venta = venta
-        self.selected_row_frame = row_frame
-        
-        # Resaltar la nueva fila seleccionada
-        if row_frame:
-            row_frame.configure(fg_color="#BFDBFE")
         
         print(f"✓ Venta seleccionada: ID {venta['id_venta']} - Cliente: {venta['cliente_nombre']}")
     
@@ -305,9 +210,9 @@ class VentaView(ctk.CTkFrame):
         scroll_frame = ctk.CTkScrollableFrame(form_frame, fg_color="transparent")
         scroll_frame.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Obtener autos y clientes
-        success_autos, autos = AutoController.obtener_todos()
-        success_clientes, clientes = ClienteController.obtener_todos()
+        # Solo la primera página de autos y clientes; al escribir se busca en la base de datos
+        success_autos, autos = AutoController.obtener_pagina(limite=self.OPCIONES_COMBO)
+        success_clientes, clientes = ClienteController.obtener_pagina(limite=self.OPCIONES_COMBO)
         
         if not success_autos or not success_clientes:
             messagebox.showerror("Error", "No se pudieron cargar los datos necesarios")
@@ -323,7 +228,7 @@ class VentaView(ctk.CTkFrame):
         )
         label_cliente.pack(anchor="w", padx=0, pady=(5, 5))
         
-        clientes_dict = {f"{c['nombre']} (ID: {c['id_cliente']})": c['id_cliente'] for c in clientes}
+        clientes_dict = {self.cliente_label(c): c['id_cliente'] for c in clientes['items']}
         cliente_var = ctk.StringVar()
         cliente_combo = ctk.CTkComboBox(
             scroll_frame,
@@ -332,6 +237,10 @@ class VentaView(ctk.CTkFrame):
             height=35
         )
         cliente_combo.pack(fill="x", padx=0)
+        self.bind_combo_search(
+            cliente_combo, form_window, ClienteController.buscar_clientes,
+            clientes_dict, self.cliente_label, 'id_cliente'
+        )
         
         # Auto
         label_auto = ctk.CTkLabel(
@@ -342,7 +251,7 @@ class VentaView(ctk.CTkFrame):
         )
         label_auto.pack(anchor="w", padx=0, pady=(10, 5))
         
-        autos_dict = {f"{a['marca']} {a['modelo']} {a['anio']} - ${a['precio']:,.2f}": a['id_auto'] for a in autos}
+        autos_dict = {self.auto_label(a): a['id_auto'] for a in autos['items']}
         auto_var = ctk.StringVar()
         auto_combo = ctk.CTkComboBox(
             scroll_frame,
@@ -351,6 +260,10 @@ class VentaView(ctk.CTkFrame):
             height=35
         )
         auto_combo.pack(fill="x", padx=0)
+        self.bind_combo_search(
+            auto_combo, form_window, AutoController.buscar_autos,
+            autos_dict, self.auto_label, 'id_auto'
+        )
         
         # Monto
         label_monto = ctk.CTkLabel(
@@ -424,6 +337,54 @@ class VentaView(ctk.CTkFrame):
         )
         btn_cancelar.pack(side="left", padx=10)
     
+    @staticmethod
+    def cliente_label(cliente):
+        """Texto de un cliente en el combo del formulario"""
+        return f"{cliente['nombre']} (ID: {cliente['id_cliente']})"
+    
+    @staticmethod
+    def auto_label(auto):
+        """Texto de un auto en el combo del formulario"""
+        return f"{auto['marca']} {auto['modelo']} {auto['anio']} - ${auto['precio']:,.2f}"
+    
+    def bind_combo_search(self, combo, window, buscar, opciones, etiqueta, llave):
+        """
+        Filtra las opciones de un combo en la base de datos mientras se escribe
+        
+        Args:
+            combo: CTkComboBox a filtrar
+            window: Ventana del formulario (dueña de las búsquedas)
+            buscar (function): Búsqueda del controlador, recibe el criterio
+            opciones (dict): Texto -> ID; se amplía con cada resultado para
+                             que save_venta reconozca cualquier opción mostrada
+            etiqueta (function): Texto de un registro en el combo
+            llave (str): Columna con el ID del registro
+        """
+        iniciales = list(opciones.keys())
+        
+        def mostrar(resultado):
+            success, items = resultado
+            if not success:
+                print(f"⚠️ {items}")
+                return
+            
+            if items is None:
+                valores = iniciales
+            else:
+                valores = []
+                for item in items[:self.OPCIONES_COMBO]:
+                    texto = etiqueta(item)
+                    opciones[texto] = item[llave]
+                    valores.append(texto)
+            combo.configure(values=valores)
+        
+        search = DebouncedSearch(
+            window,
+            lambda criterio: buscar(criterio) if criterio else (True, None),
+            mostrar
+        )
+        combo.bind("<KeyRelease>", lambda event: search.schedule(combo.get().strip()))
+    
     def save_venta(self, clientes_dict, cliente_var, autos_dict, auto_var, monto_entry, metodo_var, fecha_entry, window):
         """Guarda la venta"""
         # Obtener valores
@@ -437,16 +398,20 @@ class VentaView(ctk.CTkFrame):
             messagebox.showerror("Error", "Debe seleccionar un cliente y un auto")
             return
         
-        id_cliente = clientes_dict[cliente_key]
-        id_auto = autos_dict[auto_key]
+        id_cliente = clientes_dict.get(cliente_key)
+        id_auto = autos_dict.get(auto_key)
+        
+        if id_cliente is None or id_auto is None:
+            messagebox.showerror("Error", "Debe elegir el cliente y el auto de la lista")
+            return
         
         success, result = VentaController.crear_venta(id_auto, id_cliente, monto, metodo_pago, fecha)
         
         if success:
             # Destruir ventana primero para evitar que se sobreponga
             window.destroy()
-            # Recargar datos
-            self.load_ventas()
+            # Agregar solo la fila de la venta registrada
+            self.refresh_venta(result)
             # Mostrar mensaje después
             messagebox.showinfo("Éxito", "Venta registrada correctamente")
         else:
@@ -468,21 +433,36 @@ class VentaView(ctk.CTkFrame):
         
         if success:
             messagebox.showinfo("Éxito", "Venta eliminada correctamente")
-            self.selected_venta = None
-            self.load_ventas()
+            self.table.remove_item(venta['id_venta'])
+            self.selected_venta = self.table.selected_item
         else:
             messagebox.showerror("Error", result)
     
     def generar_pdf(self):
-        """Genera un PDF de la venta seleccionada e invoca el diálogo de impresión"""
+        """Genera un PDF de la venta seleccionada en segundo plano"""
         if not self.selected_venta:
             messagebox.showwarning("Advertencia", "Debe seleccionar una venta para generar el PDF")
             return
         
+        venta = self.selected_venta
+        filename = f"venta_{venta['id_venta']}_comprobante.pdf"
+        
+        # El PDF se arma en un hilo de trabajo y el resultado vuelve al hilo de Tk
+        dispatcher.run(
+            lambda: pdf_generator.generate_venta_report(venta, filename),
+            self.show_pdf_result,
+            widget=self
+        )
+    
+    def show_pdf_result(self, resultado):
+        """Ofrece imprimir o abrir el PDF generado (hilo de Tk)"""
+        success, output_path = resultado
+        
+        if not success:
+            messagebox.showerror("Error", f"Error al generar PDF: {output_path}")
+            return
+        
         try:
-            filename = f"venta_{self.selected_venta['id_venta']}_comprobante.pdf"
-            output_path = pdf_generator.generate_venta_report(self.selected_venta, filename)
-            
             # Preguntar qué acción desea realizar
             respuesta = messagebox.askyesnocancel(
                 "Comprobante Generado",
@@ -500,4 +480,4 @@ class VentaView(ctk.CTkFrame):
                 pdf_generator.open_pdf(output_path)
             
         except Exception as e:
-            messagebox.showerror("Error", f"Error al generar PDF: {str(e)}")
+            messagebox.showerror("Error", f"Error al abrir el PDF: {str(e)}")
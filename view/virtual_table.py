@@ -0,0 +1,707 @@
+"""
+Tabla virtualizada para listas grandes
+Solo crea los widgets de las filas visibles (más un margen) y los reutiliza
+al desplazarse, así el costo depende de la altura de la ventana y no de la
+cantidad de registros
+"""
+import math
+import unicodedata
+import tkinter as tk
+import customtkinter as ctk
+
+def collation_key(text):
+    """
+    Clave de orden de texto equivalente a las intercalaciones *_ci de MySQL
+    
+    Ignora mayúsculas y acentos (la "ñ" se ordena como "n"), como las
+    intercalaciones por defecto del servidor (utf8mb4_0900_ai_ci o
+    utf8mb4_general_ci), para que sort_key coincida con ORDER BY.
+    """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+class _Row:
+    """Fila reutilizable del grupo de filas de la tabla"""
+    
+    def __init__(self, frame, window, widgets):
+        self.frame = frame
+        self.window = window
+        self.widgets = widgets
+        self.index = None
+        self.item = None
+
+class VirtualTable(ctk.CTkFrame):
+    """Lista desplazable que recicla un grupo fijo de filas"""
+    
+    ROW_COLORS = ("#FFFFFF", "#F9FAFB")
+    HOVER_COLOR = "#DBEAFE"
+    SELECTED_COLOR = "#BFDBFE"
+    
+    def __init__(self, parent, row_height, create_row, update_row, key=None, on_select=None,
+                 sort_key=None, reverse=False, on_viewport=None, overscan=3, row_gap=2,
+                 fg_color="#FFFFFF", **kwargs):
+        """
+        Args:
+            parent: Widget contenedor
+            row_height (int): Alto fijo de cada fila en píxeles
+            create_row (function): create_row(frame) crea los widgets de una fila
+                                   vacía y retorna un dict con ellos
+            update_row (function): update_row(widgets, item, index) muestra un
+                                   registro en una fila existente
+            key (function): Obtiene la llave única de un registro (para la selección)
+            on_select (function): Se llama con el registro al hacer clic en una fila
+            sort_key (function): Orden de la lista, para ubicar los registros insertados
+                                 (sin él se insertan al inicio)
+            reverse (bool): Si el orden de sort_key es descendente
+            on_viewport (function): on_viewport(first, last) se llama cuando cambia
+                                    el rango de índices visibles o los registros
+            overscan (int): Filas extra que se mantienen arriba y abajo del área visible
+            row_gap (int): Separación vertical entre filas
+        """
+        super().__init__(parent, fg_color=fg_color, corner_radius=0, **kwargs)
+        
+        self.row_height = row_height
+        self.row_stride = row_height + row_gap
+        self.create_row = create_row
+        self.update_row = update_row
+        self.key = key or (lambda item: id(item))
+        self.on_select = on_select
+        self.sort_key = sort_key
+        self.reverse = reverse
+        self.on_viewport = on_viewport
+        self.overscan = overscan
+        
+        self._items = []
+        self._positions = {}  # llave -> índice en self._items
+        self._rows = []
+        self._selected_key = None
+        self._complete = True  # False mientras falten páginas por cargar
+        self._boundary = None  # sort_key del último registro de la última página
+        self._ordered = True  # False si la lista no sigue sort_key (p. ej. una búsqueda)
+        self._viewport = None  # Último (primero, último) notificado
+        self._width = 1
+        self._height = 1
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+        
+        self.canvas = tk.Canvas(
+            self,
+            highlightthickness=0,
+            borderwidth=0,
+            background=fg_color,
+            yscrollincrement=self.row_stride
+        )
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.bind("<Configure>", self._on_configure)
+        self._bind_wheel(self.canvas)
+    
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+    
+    def set_items(self, items, keep_position=True, complete=True, ordered=True):
+        """
+        Reemplaza los registros mostrados
+        
+        Solo se actualizan las filas visibles; no se crean widgets nuevos.
+        
+        Args:
+            items (list): Registros
+            keep_position (bool): Conservar el desplazamiento actual
+            complete (bool): False si la lista es solo la primera página
+                             (ver append_items)
+            ordered (bool): False si la lista no sigue sort_key (p. ej.
+                            resultados por relevancia): los registros nuevos
+                            se agregan al final y los editados no se mueven
+        """
+        self._complete = complete
+        self._ordered = ordered
+        self._items = list(items)
+        self._boundary = None
+        self._mark_boundary(self._items)
+        self._reindex()
+        self._update_scrollregion()
+        if not keep_position:
+            self.canvas.yview_moveto(0)
+        self._refresh(force=True)
+    
+    def append_items(self, items, complete=True):
+        """
+        Agrega al final la página siguiente de registros
+        
+        Si un registro de la página ya está en la tabla (p. ej. editado con
+        upsert_item a un orden que cae en esta página), se reemplaza y pasa a
+        la posición que trae la página.
+        
+        Args:
+            items (list): Registros de la página
+            complete (bool): Si era la última página
+        """
+        self._complete = complete
+        self._mark_boundary(items)
+        
+        keys = {self.key(item) for item in items}
+        if keys & self._positions.keys():
+            self._items = [item for item in self._items if self.key(item) not in keys]
+            self._items.extend(items)
+            self._reindex()
+        else:
+            for item in items:
+                self._positions[self.key(item)] = len(self._items)
+                self._items.append(item)
+        self._update_scrollregion()
+        
+        # Avisar del área visible aunque no cambie: hay registros nuevos después de ella
+        self._viewport = None
+        self._refresh()
+    
+    def get_items(self):
+        """Retorna los registros mostrados"""
+        return self._items
+    
+    @property
+    def selected_item(self):
+        """Registro seleccionado actualmente (o None)"""
+        index = self._positions.get(self._selected_key)
+        return self._items[index] if index is not None else None
+    
+    def upsert_item(self, item):
+        """
+        Inserta o actualiza un registro sin reconstruir la tabla
+        
+        Si el registro ya existe y su posición no cambia, solo se vuelve a
+        dibujar su fila (y únicamente si está visible).
+        """
+        index = self._positions.get(self.key(item))
+        if index is None:
+            self._insert(item)
+            return
+        
+        if self.sort_key is not None and self._ordered:
+            self._items.pop(index)
+            position = self._position_for(item)
+            if position != index and self._beyond_loaded(item):
+                # Pasó a una página que aún no se cargó: llegará con ella
+                self._positions.pop(self.key(item))
+                self._reindex(index)
+                self._update_scrollregion()
+                self._refresh(force=True)
+                return
+            self._items.insert(position, item)
+            if position != index:
+                self._reindex(min(index, position), max(index, position) + 1)
+                self._refresh(force=True)
+                return
+        
+        self._items[index] = item
+        row = self._visible_row(index)
+        if row is not None:
+            self._bind_row(row, index)
+    
+    def remove_item(self, key):
+        """Quita un registro por su llave sin reconstruir la tabla"""
+        index = self._positions.pop(key, None)
+        if index is None:
+            return
+        
+        self._items.pop(index)
+        self._reindex(index)
+        if key == self._selected_key:
+            self._selected_key = None
+        self._update_scrollregion()
+        self._refresh(force=True)
+    
+    def clear_selection(self):
+        """Quita la selección actual"""
+        self._selected_key = None
+        self._repaint()
+    
+    def is_visible(self, index):
+        """Indica si el índice está dentro del área visible (sin el margen extra)"""
+        first, last = self.visible_range()
+        return first <= index <= last
+    
+    def visible_range(self):
+        """Primer y último índice dentro del área visible (sin el margen extra)"""
+        top = self.canvas.canvasy(0)
+        first = int(top // self.row_stride)
+        last = min(len(self._items) - 1, int((top + self._height) // self.row_stride))
+        return first, last
+    
+    def refresh(self):
+        """Vuelve a dibujar las filas visibles"""
+        self._refresh(force=True)
+    
+    # ------------------------------------------------------------------
+    # Filas reutilizables
+    # ------------------------------------------------------------------
+    
+    def _create_pooled_row(self):
+        """Crea una fila vacía y la agrega al grupo"""
+        frame = ctk.CTkFrame(
+            self.canvas,
+            fg_color=self.ROW_COLORS[0],
+            corner_radius=0,
+            height=self.row_height
+        )
+        widgets = self.create_row(frame)
+        window = self.canvas.create_window(
+            0, 0,
+            window=frame,
+            anchor="nw",
+            width=self._width,
+            height=self.row_height,
+            state="hidden"
+        )
+        row = _Row(frame, window, widgets)
+        
+        frame.configure(cursor="hand2")
+        frame.bind("<Enter>", lambda e, r=row: self._on_enter(r))
+        frame.bind("<Leave>", lambda e, r=row: self._on_leave(r))
+        self._bind_row_events(frame, row)
+        
+        self._rows.append(row)
+        return row
+    
+    def _bind_row_events(self, widget, row):
+        """Vincula clic y rueda del mouse a un widget de la fila y sus hijos"""
+        self._bind_wheel(widget)
+        
+        # Los botones de acción conservan su propio comando
+        if isinstance(widget, ctk.CTkButton):
+            return
+        
+        widget.bind("<Button-1>", lambda e, r=row: self._on_click(r))
+        for child in widget.winfo_children():
+            self._bind_row_events(child, row)
+    
+    def _ensure_pool(self):
+        """Crea las filas necesarias para cubrir el área visible"""
+        needed = math.ceil(self._height / self.row_stride) + 1 + 2 * self.overscan
+        while len(self._rows) < needed:
+            self._create_pooled_row()
+    
+    def _bind_row(self, row, index):
+        """Asocia una fila del grupo a un registro"""
+        row.index = index
+        row.item = self._items[index]
+        self.canvas.coords(row.window, 0, index * self.row_stride)
+        self.canvas.itemconfigure(row.window, state="normal")
+        row.frame.configure(fg_color=self._row_color(row))
+        self.update_row(row.widgets, row.item, index)
+    
+    def _hide_row(self, row):
+        """Oculta una fila que quedó fuera del rango visible"""
+        if row.index is None:
+            return
+        row.index = None
+        row.item = None
+        self.canvas.itemconfigure(row.window, state="hidden")
+    
+    def _refresh(self, force=False):
+        """Asocia las filas del grupo al rango visible actual"""
+        pool = len(self._rows)
+        if pool == 0:
+            return
+        
+        top = self.canvas.canvasy(0)
+        first = max(0, int(top // self.row_stride) - self.overscan)
+        last = min(len(self._items), first + pool)
+        
+        # Cada índice usa siempre la misma fila (índice % tamaño del grupo),
+        # así al desplazarse una fila solo se vuelve a dibujar una fila
+        in_use = set()
+        for index in range(first, last):
+            slot = index % pool
+            in_use.add(slot)
+            row = self._rows[slot]
+            if force or row.index != index:
+                self._bind_row(row, index)
+        
+        for slot, row in enumerate(self._rows):
+            if slot not in in_use:
+                self._hide_row(row)
+        
+        self._notify_viewport(force)
+    
+    def _notify_viewport(self, force=False):
+        """Avisa del rango visible si cambió (o si cambiaron los registros)"""
+        if self.on_viewport is None:
+            return
+        viewport = self.visible_range()
+        if force or viewport != self._viewport:
+            self._viewport = viewport
+            self.on_viewport(*viewport)
+    
+    def _visible_row(self, index):
+        """Fila del grupo que muestra el índice dado (o None si no está visible)"""
+        if not self._rows:
+            return None
+        row = self._rows[index % len(self._rows)]
+        return row if row.index == index else None
+    
+    # ------------------------------------------------------------------
+    # Índice por llave
+    # ------------------------------------------------------------------
+    
+    def _reindex(self, start=0, end=None):
+        """Actualiza el mapa llave -> índice desde la posición indicada"""
+        if start == 0 and end is None:
+            self._positions = {}
+        end = len(self._items) if end is None else end
+        for index in range(start, end):
+            self._positions[self.key(self._items[index])] = index
+    
+    def _position_for(self, item):
+        """Posición donde insertar un registro según sort_key (búsqueda binaria)"""
+        if not self._ordered:
+            return len(self._items)
+        if self.sort_key is None:
+            return 0
+        
+        value = self.sort_key(item)
+        low, high = 0, len(self._items)
+        while low < high:
+            middle = (low + high) // 2
+            current = self.sort_key(self._items[middle])
+            before = current > value if self.reverse else current < value
+            if before:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def _insert(self, item):
+        """Inserta un registro nuevo en su posición"""
+        if self._beyond_loaded(item):
+            return
+        position = self._position_for(item)
+        self._items.insert(position, item)
+        self._reindex(position)
+        self._update_scrollregion()
+        self._refresh(force=True)
+    
+    def _mark_boundary(self, page):
+        """Recuerda el orden del último registro de una página (cursor de la siguiente)"""
+        if page and self.sort_key is not None:
+            self._boundary = self.sort_key(page[-1])
+    
+    def _beyond_loaded(self, item):
+        """
+        Indica si un registro cae después de la última página cargada
+        
+        Solo ocurre si quedan páginas pendientes y su orden es estrictamente
+        posterior al último registro que recorrió el cursor; en ese caso
+        llegará con las páginas siguientes.
+        """
+        if self._complete or not self._ordered or self._boundary is None:
+            return False
+        value = self.sort_key(item)
+        return value < self._boundary if self.reverse else value > self._boundary
+    
+    def _update_scrollregion(self):
+        """Ajusta el alto desplazable a la cantidad de registros"""
+        height = max(len(self._items) * self.row_stride, 1)
+        self.canvas.configure(scrollregion=(0, 0, self._width, height))
+    
+    # ------------------------------------------------------------------
+    # Selección y hover
+    # ------------------------------------------------------------------
+    
+    def _row_color(self, row):
+        """Color de fondo de una fila según selección y posición"""
+        if row.item is not None and self.key(row.item) == self._selected_key:
+            return self.SELECTED_COLOR
+        return self.ROW_COLORS[(row.index or 0) % 2]
+    
+    def _repaint(self):
+        """Actualiza el color de las filas visibles"""
+        for row in self._rows:
+            if row.index is not None:
+                row.frame.configure(fg_color=self._row_color(row))
+    
+    def _on_click(self, row):
+        """Selecciona el registro de la fila"""
+        if row.item is None:
+            return
+        self._selected_key = self.key(row.item)
+        self._repaint()
+        if self.on_select:
+            self.on_select(row.item)
+    
+    def _on_enter(self, row):
+        """Resalta la fila bajo el cursor"""
+        if row.item is not None and self.key(row.item) != self._selected_key:
+            row.frame.configure(fg_color=self.HOVER_COLOR)
+    
+    def _on_leave(self, row):
+        """Restaura el color de la fila al salir el cursor"""
+        if row.item is not None:
+            row.frame.configure(fg_color=self._row_color(row))
+    
+    # ------------------------------------------------------------------
+    # Desplazamiento
+    # ------------------------------------------------------------------
+    
+    def _bind_wheel(self, widget):
+        """Permite desplazar la tabla con la rueda del mouse sobre el widget"""
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
+    
+    def _on_wheel(self, event):
+        """Desplaza tres filas por paso de la rueda (Windows, macOS y Linux)"""
+        if getattr(event, 'num', None) == 4:
+            step = -1
+        elif getattr(event, 'num', None) == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self.canvas.yview_scroll(step * 3, "units")
+        return "break"
+    
+    def _on_yscroll(self, first, last):
+        """Sincroniza la barra de desplazamiento y las filas visibles"""
+        self.scrollbar.set(first, last)
+        self._refresh()
+    
+    def _on_configure(self, event):
+        """Ajusta el ancho de las filas y el tamaño del grupo al redimensionar"""
+        self._width = event.width
+        self._height = event.height
+        for row in self._rows:
+            self.canvas.itemconfigure(row.window, width=self._width)
+        self._update_scrollregion()
+        self._ensure_pool()
+        self._refresh(force=True)
+
+class DataTable(ctk.CTkFrame):
+    """
+    Tabla con encabezados definida por una lista de columnas
+    
+    Cada columna es un dict con:
+        header (str): Texto del encabezado
+        weight (int): Peso de la columna en el grid
+        value (function): value(item) retorna el texto de la celda
+        create / update (function): Celda personalizada; create(cell_frame)
+                                    crea sus widgets y update(widgets, item, index)
+                                    la actualiza
+        actions (list): Botones de acción (ver edit_action y delete_action)
+    """
+    
+    def __init__(self, parent, columns, row_height=50, key=None, on_select=None,
+                 sort_key=None, reverse=False, on_viewport=None, fg_color="#FFFFFF",
+                 corner_radius=10, **kwargs):
+        """
+        Args:
+            parent: Widget contenedor
+            columns (list): Definición de las columnas
+            row_height (int): Alto fijo de cada fila en píxeles
+            key (function): Obtiene la llave única de un registro
+            on_select (function): Se llama con el registro al seleccionar una fila
+            sort_key (function): Orden de la lista para ubicar registros insertados
+            reverse (bool): Si el orden de sort_key es descendente
+            on_viewport (function): on_viewport(first, last) al cambiar el rango visible
+        """
+        super().__init__(parent, fg_color=fg_color, corner_radius=corner_radius, **kwargs)
+        
+        self.columns = columns
+        self.cell_height = row_height - 10
+        
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+        
+        self.create_headers()
+        
+        self.body = VirtualTable(
+            self,
+            row_height=row_height,
+            create_row=self._create_row,
+            update_row=self._update_row,
+            key=key,
+            on_select=on_select,
+            sort_key=sort_key,
+            reverse=reverse,
+            on_viewport=on_viewport
+        )
+        self.body.grid(row=1, column=0, sticky="nsew")
+    
+    @staticmethod
+    def edit_action(command):
+        """Botón de editar; command recibe el registro de la fila"""
+        return {
+            'icon': "✎",
+            'font': {'family': "Segoe UI Symbol", 'size': 18, 'weight': "bold"},
+            'fg_color': "#6366F1",
+            'hover_color': "#4F46E5",
+            'command': command
+        }
+    
+    @staticmethod
+    def delete_action(command):
+        """Botón de eliminar; command recibe el registro de la fila"""
+        return {
+            'icon': "🗑",
+            'font': {'family': "Segoe UI Emoji", 'size': 18},
+            'fg_color': "#EF4444",
+            'hover_color': "#DC2626",
+            'command': command
+        }
+    
+    # ------------------------------------------------------------------
+    # API pública (delegada a la tabla virtualizada)
+    # ------------------------------------------------------------------
+    
+    def set_items(self, items, keep_position=True, complete=True, ordered=True):
+        """Reemplaza los registros mostrados"""
+        self.body.set_items(items, keep_position, complete, ordered)
+    
+    def append_items(self, items, complete=True):
+        """Agrega al final la página siguiente de registros"""
+        self.body.append_items(items, complete)
+    
+    def get_items(self):
+        """Retorna los registros mostrados"""
+        return self.body.get_items()
+    
+    @property
+    def selected_item(self):
+        """Registro seleccionado actualmente (o None)"""
+        return self.body.selected_item
+    
+    def upsert_item(self, item):
+        """Inserta o actualiza un registro sin reconstruir la tabla"""
+        self.body.upsert_item(item)
+    
+    def remove_item(self, key):
+        """Quita un registro por su llave sin reconstruir la tabla"""
+        self.body.remove_item(key)
+    
+    def clear_selection(self):
+        """Quita la selección actual"""
+        self.body.clear_selection()
+    
+    def is_visible(self, index):
+        """Indica si el índice está dentro del área visible"""
+        return self.body.is_visible(index)
+    
+    def visible_range(self):
+        """Primer y último índice dentro del área visible"""
+        return self.body.visible_range()
+    
+    def refresh(self):
+        """Vuelve a dibujar las filas visibles"""
+        self.body.refresh()
+    
+    # ------------------------------------------------------------------
+    # Construcción
+    # ------------------------------------------------------------------
+    
+    def create_headers(self):
+        """Crea la fila de encabezados"""
+        headers_frame = ctk.CTkFrame(self, fg_color="#F9FAFB", corner_radius=0, height=45)
+        headers_frame.grid(row=0, column=0, sticky="ew")
+        headers_frame.grid_propagate(False)
+        
+        # Crear encabezados con celdas para alineación perfecta
+        for i, column in enumerate(self.columns):
+            headers_frame.grid_columnconfigure(i, weight=column.get('weight', 1))
+            
+            header_cell = ctk.CTkFrame(headers_frame, fg_color="transparent", height=45)
+            header_cell.grid(row=0, column=i, sticky="nsew", padx=5)
+            header_cell.grid_propagate(False)
+            
+            label = ctk.CTkLabel(
+                header_cell,
+                text=column['header'],
+                font=ctk.CTkFont(family="Inter", size=13, weight="bold"),
+                text_color="#1F2937",
+                anchor="center"
+            )
+            label.place(relx=0.5, rely=0.5, anchor="center")
+    
+    def _create_row(self, row_frame):
+        """Crea los widgets de una fila vacía según las columnas"""
+        widgets = {'item': None, 'cells': []}
+        
+        data_frame = ctk.CTkFrame(row_frame, fg_color="transparent")
+        data_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        for col, column in enumerate(self.columns):
+            data_frame.grid_columnconfigure(col, weight=column.get('weight', 1))
+            
+            cell_frame = ctk.CTkFrame(data_frame, fg_color="transparent", height=self.cell_height)
+            cell_frame.grid(row=0, column=col, sticky="nsew", padx=5)
+            cell_frame.grid_propagate(False)
+            
+            if 'actions' in column:
+                cell = self._create_actions(cell_frame, column['actions'], widgets)
+            elif 'create' in column:
+                cell = column['create'](cell_frame)
+            else:
+                cell = ctk.CTkLabel(
+                    cell_frame,
+                    text="",
+                    font=ctk.CTkFont(family="Inter", size=12),
+                    text_color="#374151",
+                    anchor="center"
+                )
+                cell.place(relx=0.5, rely=0.5, anchor="center")
+            
+            widgets['cells'].append(cell)
+        
+        return widgets
+    
+    def _create_actions(self, cell_frame, actions, widgets):
+        """Crea los botones de acción de una fila"""
+        buttons_container = ctk.CTkFrame(cell_frame, fg_color="transparent")
+        buttons_container.place(relx=0.5, rely=0.5, anchor="center")
+        
+        for action in actions:
+            # La acción usa el registro asociado a la fila al momento del clic
+            def command(action=action):
+                if widgets['item'] is not None:
+                    action['command'](widgets['item'])
+            
+            button = ctk.CTkButton(
+                buttons_container,
+                text="",
+                width=40,
+                height=40,
+                fg_color=action['fg_color'],
+                hover_color=action['hover_color'],
+                corner_radius=10,
+                border_width=0,
+                command=command
+            )
+            button.pack(side="left", padx=4)
+            
+            icon_label = ctk.CTkLabel(
+                button,
+                text=action['icon'],
+                font=ctk.CTkFont(**action['font']),
+                text_color="#FFFFFF"
+            )
+            icon_label.place(relx=0.5, rely=0.5, anchor="center")
+            icon_label.configure(cursor="hand2")
+            icon_label.bind("<Button-1>", lambda e, c=command: c())
+        
+        return buttons_container
+    
+    def _update_row(self, widgets, item, index):
+        """Muestra un registro en una fila existente"""
+        widgets['item'] = item
+        
+        for column, cell in zip(self.columns, widgets['cells']):
+            if 'actions' in column:
+                continue
+            if 'update' in column:
+                column['update'](cell, item, index)
+            else:
+                cell.configure(text=str(column['value'](item)))